@@ -1,10 +1,120 @@
 from typing import List, Dict, Any, Set, Tuple
+
+import numpy as np
+
 from automata.finite_automata import FiniteAutomaton
 
+# Groups of equal-length strings smaller than this are run one at a time.
+_LOCKSTEP_MIN = 8
+# Upper bound on symbols held in memory per lock-step chunk.
+_LOCKSTEP_BLOCK = 1 << 22
+
+
+class CompiledDFA:
+    def __init__(self, dfa: 'DFA'):
+        self.state_names = sorted(dfa.states, key=str)
+        self.symbols = sorted(dfa.alphabet, key=str)
+        state_ids = {state: i for i, state in enumerate(self.state_names)}
+        self.symbol_ids = {symbol: i for i, symbol in enumerate(self.symbols)}
+        num_symbols = len(self.symbols)
+        self.table = np.zeros((len(self.state_names), num_symbols), dtype=np.int32)
+        # Tuple keys go last so they win over "state,symbol" keys, as in lookups before compiling.
+        for key, target in sorted(dfa.transitions.items(), key=lambda item: isinstance(item[0], tuple)):
+            state, symbol = key if isinstance(key, tuple) else key.split(',')
+            self.table[state_ids[state], self.symbol_ids[symbol]] = state_ids[target]
+        self.start = state_ids[dfa.start_state]
+        self.accepting = np.zeros(len(self.state_names), dtype=bool)
+        for state in dfa.accept_states:
+            self.accepting[state_ids[state]] = True
+
+        # Plain lists for the per-character loop, flat arrays for lock-step runs.
+        self._rows = self.table.tolist()
+        self._accepting = self.accepting.tolist()
+        # Entries are pre-multiplied by the row length, so a step is one gather.
+        self._flat = (self.table * num_symbols).ravel().astype(np.int64)
+        # Input is consumed character by character, so only one-character symbols can match.
+        chars = {symbol: i for symbol, i in self.symbol_ids.items() if len(symbol) == 1}
+        id_dtype = np.int16 if num_symbols < 2 ** 15 else np.int32
+        self._code_ids = np.full(max(256, max(map(ord, chars), default=0) + 1), -1, dtype=id_dtype)
+        for symbol, i in chars.items():
+            self._code_ids[ord(symbol)] = i
+
+    def _unknown_symbol(self, input_string: str) -> ValueError:
+        for symbol in input_string:
+            if symbol not in self.symbol_ids:
+                return ValueError(f"Symbol '{symbol}' not in alphabet")
+        return ValueError("Input contains symbols outside the alphabet")
+
+    def run(self, input_string: str) -> Tuple[bool, List[Any]]:
+        rows, symbol_ids = self._rows, self.symbol_ids
+        state = self.start
+        trace = [state]
+        try:
+            for symbol in input_string:
+                state = rows[state][symbol_ids[symbol]]
+                trace.append(state)
+        except KeyError:
+            raise self._unknown_symbol(input_string) from None
+        names = self.state_names
+        return self._accepting[state], [names[i] for i in trace]
+
+    def accepts(self, input_string: str) -> bool:
+        rows, symbol_ids = self._rows, self.symbol_ids
+        state = self.start
+        try:
+            for symbol in input_string:
+                state = rows[state][symbol_ids[symbol]]
+        except KeyError:
+            raise self._unknown_symbol(input_string) from None
+        return self._accepting[state]
+
+    def _lockstep(self, strings: List[str], length: int) -> np.ndarray:
+        joined = ''.join(strings)
+        try:
+            codes = np.frombuffer(joined.encode('latin-1'), dtype=np.uint8)
+        except UnicodeEncodeError:
+            codes = np.frombuffer(joined.encode('utf-32-le'), dtype=np.uint32)
+        unknown = codes >= len(self._code_ids)
+        if not unknown.any():
+            ids = self._code_ids[codes]
+            unknown = ids < 0
+        if unknown.any():
+            raise self._unknown_symbol(strings[int(np.argmax(unknown)) // length])
+        # One gather per input position advances every string at once.
+        states = np.full(len(strings), self.start * len(self.symbols), dtype=np.int64)
+        for column in np.ascontiguousarray(ids.reshape(len(strings), length).T):
+            states = self._flat[states + column]
+        return self.accepting[states // max(1, len(self.symbols))]
+
+    def _accepts_block(self, strings: List[str], length: int) -> List[bool]:
+        if length == 0 or len(strings) < _LOCKSTEP_MIN:
+            return [self.accepts(string) for string in strings]
+        chunk = max(1, _LOCKSTEP_BLOCK // length)
+        results = []
+        for start in range(0, len(strings), chunk):
+            results.extend(self._lockstep(strings[start:start + chunk], length).tolist())
+        return results
+
+    def accepts_many(self, strings: List[str]) -> List[bool]:
+        strings = list(strings)
+        lengths = [len(string) for string in strings]
+        if not strings or min(lengths) == max(lengths):
+            return self._accepts_block(strings, lengths[0] if strings else 0)
+        results = [False] * len(strings)
+        by_length: Dict[int, List[int]] = {}
+        for i, length in enumerate(lengths):
+            by_length.setdefault(length, []).append(i)
+        for length, indices in by_length.items():
+            for i, accepted in zip(indices, self._accepts_block([strings[i] for i in indices], length)):
+                results[i] = accepted
+        return results
+
+
 class DFA(FiniteAutomaton):
     def __init__(self, states, alphabet, transitions, start_state, accept_states):
         super().__init__(states, alphabet, transitions, start_state, accept_states)
         self._validate()
+        self._compiled = None
 
     def _validate(self):
         for key in self.transitions:
@@ -24,24 +134,19 @@ class DFA(FiniteAutomaton):
         if missing_transitions:
             raise ValueError(f"DFA is incomplete. Missing transitions for: {missing_transitions}")
 
+    def compile(self) -> CompiledDFA:
+        if self._compiled is None:
+            self._compiled = CompiledDFA(self)
+        return self._compiled
+
     def process_string(self, input_string: str) -> Tuple[bool, List[Any]]:
-        current_state = self.start_state
-        trace = [current_state]
-        for symbol in input_string:
-            if symbol not in self.alphabet:
-                raise ValueError(f"Symbol '{symbol}' not in alphabet")
-            key = (current_state, symbol)
-            if key not in self.transitions:
-                key = f"{current_state},{symbol}"
-                if key not in self.transitions:
-                    raise ValueError(f"No transition defined for state '{current_state}' with symbol '{symbol}'")
-            current_state = self.transitions[key]
-            trace.append(current_state)
-        return (current_state in self.accept_states, trace)
+        return self.compile().run(input_string)
 
     def is_string_accepted(self, input_string: str) -> bool:
-        accepted, _ = self.process_string(input_string)
-        return accepted
+        return self.compile().accepts(input_string)
+
+    def accepts_many(self, strings: List[str]) -> List[bool]:
+        return self.compile().accepts_many(strings)
 
     def to_dict(self) -> dict:
         transitions = {}
@@ -0,0 +1,143 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from .algorithms import _dijkstra_ids, _numeric_weights, bellman_ford_arrays
+from .csr import CSRGraph, as_csr
+
+_worker_graph = None
+
+
+def _output_matrix(n, dtype, out):
+    if out is None:
+        return np.full((n, n), np.inf, dtype=dtype)
+    if isinstance(out, (str, os.PathLike)):
+        out = np.lib.format.open_memmap(out, mode='w+', dtype=dtype, shape=(n, n))
+    if out.shape != (n, n):
+        raise ValueError(f"Output matrix must have shape {(n, n)}")
+    out.fill(np.inf)
+    return out
+
+
+def dense_weight_matrix(graph, dtype=np.float64):
+    csr = as_csr(graph)
+    n = csr.num_vertices
+    matrix = np.full((n, n), np.inf, dtype=dtype)
+    matrix[csr.sources(), csr.targets] = _numeric_weights(csr)
+    np.fill_diagonal(matrix, np.minimum(np.diagonal(matrix), 0))
+    return matrix
+
+
+def floyd_warshall(graph, dtype=np.float64, out=None):
+    csr = as_csr(graph)
+    n = csr.num_vertices
+    dist = _output_matrix(n, dtype, out)
+    dist[...] = dense_weight_matrix(csr, dtype)
+    for k in range(n):
+        np.minimum(dist, dist[:, k, None] + dist[None, k, :], out=dist)
+    if n and np.diagonal(dist).min() < 0:
+        raise ValueError("Graph contains a negative-weight cycle")
+    return dist
+
+
+def _init_worker(csr):
+    global _worker_graph
+    _worker_graph = csr
+
+
+def _dijkstra_rows(csr, start, stop, dtype):
+    rows = np.full((stop - start, csr.num_vertices), np.inf, dtype=dtype)
+    for source in range(start, stop):
+        settled, _ = _dijkstra_ids(csr, [source])
+        rows[source - start, list(settled)] = list(settled.values())
+    return rows
+
+
+def _worker_rows(start, stop, dtype):
+    return start, _dijkstra_rows(_worker_graph, start, stop, dtype)
+
+
+def repeated_dijkstra(graph, dtype=np.float64, out=None, processes=None, chunk_size=64):
+    csr = as_csr(graph)
+    n = csr.num_vertices
+    dist = _output_matrix(n, dtype, out)
+    if processes is None:
+        processes = os.cpu_count() if n >= 1000 else 1
+    if processes <= 1:
+        for start in range(0, n, chunk_size):
+            stop = min(start + chunk_size, n)
+            dist[start:stop] = _dijkstra_rows(csr, start, stop, dtype)
+        return dist
+
+    with ProcessPoolExecutor(max_workers=processes, initializer=_init_worker, initargs=(csr,)) as pool:
+        futures = [pool.submit(_worker_rows, start, min(start + chunk_size, n), dtype)
+                   for start in range(0, n, chunk_size)]
+        for future in futures:
+            start, rows = future.result()
+            dist[start:start + len(rows)] = rows
+    return dist
+
+
+def _johnson_potentials(csr, weights):
+    potentials, _, cycle = bellman_ford_arrays(csr.sources(), csr.targets, weights, csr.num_vertices,
+                                               np.arange(csr.num_vertices))
+    if cycle is not None:
+        raise ValueError("Graph contains a negative-weight cycle")
+    return potentials
+
+
+def johnson(graph, dtype=np.float64, out=None, processes=None):
+    csr = as_csr(graph)
+    weights = np.asarray(_numeric_weights(csr), dtype=np.float64)
+    potentials = _johnson_potentials(csr, weights)
+    reweighted = weights + potentials[csr.sources()] - potentials[csr.targets]
+    np.maximum(reweighted, 0, out=reweighted)
+    labels = None if csr._index is None else csr.labels
+    shifted = CSRGraph(csr.offsets, csr.targets, reweighted, labels, directed=csr.directed)
+    dist = repeated_dijkstra(shifted, dtype, out, processes)
+    dist -= potentials[:, None].astype(dtype)
+    dist += potentials[None, :].astype(dtype)
+    return dist
+
+
+def all_pairs_shortest_paths(graph, method='auto', dtype=np.float64, out=None, processes=None):
+    csr = as_csr(graph)
+    n = csr.num_vertices
+    if method == 'auto':
+        if len(csr.targets) and np.min(_numeric_weights(csr)) < 0:
+            method = 'johnson'
+        elif n <= 500 or len(csr.targets) >= n * n // 8:
+            method = 'floyd_warshall'
+        else:
+            method = 'dijkstra'
+    if method == 'floyd_warshall':
+        dist = floyd_warshall(csr, dtype, out)
+    elif method == 'dijkstra':
+        dist = repeated_dijkstra(csr, dtype, out, processes)
+    elif method == 'johnson':
+        dist = johnson(csr, dtype, out, processes)
+    else:
+        raise ValueError(f"Unknown all-pairs method '{method}'")
+    return dist, list(csr.labels)
+
+
+if __name__ == '__main__':
+    from .basics import Graph
+
+    g = Graph(directed=True)
+    g.add_edge('A', 'B', 3)
+    g.add_edge('B', 'C', -2)
+    g.add_edge('A', 'C', 4)
+    g.add_edge('C', 'D', 2)
+    g.add_edge('D', 'A', 1)
+
+    for method in ('floyd_warshall', 'johnson'):
+        dist, labels = all_pairs_shortest_paths(g, method=method)
+        print(f"{method} over {labels}:\n{dist}")
+
+    g_pos = Graph()
+    g_pos.add_edge('A', 'B', 4)
+    g_pos.add_edge('B', 'C', 1)
+    dist, labels = all_pairs_shortest_paths(g_pos, method='dijkstra', dtype=np.float32)
+    print(f"dijkstra over {labels}:\n{dist}")
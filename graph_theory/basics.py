@@ -2,10 +2,36 @@ class Graph:
     def __init__(self, directed=False):
         self.adjacency_list = {} 
         self.directed = directed
+        self.version = 0
+        self._views = {}
+        self._observers = []
+
+    def add_observer(self, observer):
+        self._observers.append(observer)
+
+    def remove_observer(self, observer):
+        self._observers.remove(observer)
+
+    def _notify(self, event, *args):
+        self.version += 1
+        self._views.clear()
+        for observer in self._observers:
+            getattr(observer, event)(*args)
+
+    def cached_view(self, key, factory):
+        # Views are dropped on every mutation, so they always match self.version.
+        if key not in self._views:
+            self._views[key] = factory(self)
+        return self._views[key]
+
+    def to_csr(self):
+        from .csr import CSRGraph
+        return self.cached_view('csr', CSRGraph.from_graph)
 
     def add_vertex(self, vertex):
         if vertex not in self.adjacency_list:
             self.adjacency_list[vertex] = {} 
+            self._notify('on_vertex_added', vertex)
 
     def add_edge(self, start, end, weight=None):
         self.add_vertex(start)
@@ -15,36 +41,92 @@ class Graph:
 
         if not self.directed:
             self.adjacency_list[end][start] = weight
+        self._notify('on_edge_added', start, end, weight)
+
+    def remove_edge(self, start, end):
+        if start not in self.adjacency_list or end not in self.adjacency_list[start]:
+            raise ValueError(f"Edge ({start}, {end}) not in graph")
+        del self.adjacency_list[start][end]
+        if not self.directed:
+            self.adjacency_list[end].pop(start, None)
+        self._notify('on_edge_removed', start, end)
+
+    def remove_vertex(self, vertex):
+        if vertex not in self.adjacency_list:
+            raise ValueError(f"Vertex '{vertex}' not in graph")
+        if self.directed:
+            for neighbors in self.adjacency_list.values():
+                neighbors.pop(vertex, None)
+        else:
+            for neighbor in self.adjacency_list[vertex]:
+                if neighbor != vertex:
+                    del self.adjacency_list[neighbor][vertex]
+        del self.adjacency_list[vertex]
+        self._notify('on_vertex_removed', vertex)
+
+    def __contains__(self, vertex):
+        return vertex in self.adjacency_list
 
     def get_vertices(self):
         return list(self.adjacency_list.keys())
         
-    def get_edges(self):
-        edges = set() 
+    def _build_edges(self):
+        edges = []
         for vertex, neighbors in self.adjacency_list.items():
             for neighbor, weight in neighbors.items():
                 if not self.directed and vertex > neighbor:
                     continue
                 edge = (vertex, neighbor, weight) if weight is not None else (vertex, neighbor)
-                edges.add(edge)
-        return list(edges)
+                edges.append(edge)
+        return edges
+
+    def get_edges(self):
+        return list(self.cached_view('edges', Graph._build_edges))
         
     def get_neighbors(self, vertex):
         if vertex not in self.adjacency_list:
             raise ValueError(f"Vertex '{vertex}' not in graph")
         return list(self.adjacency_list[vertex].keys())
         
+    def _build_in_degrees(self):
+        csr = self.to_csr()
+        in_degrees = csr.in_degrees().tolist()
+        return {vertex: in_degrees[i] for i, vertex in enumerate(csr.labels)}
+
+    def _build_reverse_adjacency(self):
+        reverse = {vertex: [] for vertex in self.adjacency_list}
+        for vertex, neighbors in self.adjacency_list.items():
+            for neighbor in neighbors:
+                reverse[neighbor].append(vertex)
+        return reverse
+
+    def get_in_degree(self, vertex):
+        if vertex not in self.adjacency_list:
+            raise ValueError(f"Vertex '{vertex}' not in graph")
+        if not self.directed:
+            return self.get_degree(vertex)
+        return self.cached_view('in_degrees', Graph._build_in_degrees)[vertex]
+
+    def get_out_degree(self, vertex):
+        if vertex not in self.adjacency_list:
+            raise ValueError(f"Vertex '{vertex}' not in graph")
+        if not self.directed:
+            return self.get_degree(vertex)
+        return len(self.adjacency_list[vertex])
+
+    def get_predecessors(self, vertex):
+        if vertex not in self.adjacency_list:
+            raise ValueError(f"Vertex '{vertex}' not in graph")
+        if not self.directed:
+            return self.get_neighbors(vertex)
+        return list(self.cached_view('reverse', Graph._build_reverse_adjacency)[vertex])
+
     def get_degree(self, vertex):
         if vertex not in self.adjacency_list:
             raise ValueError(f"Vertex '{vertex}' not in graph")
             
         if self.directed:
-            in_degree = 0
-            for _, neighbors in self.adjacency_list.items():
-                if vertex in neighbors:
-                    in_degree += 1
-            out_degree = len(self.adjacency_list[vertex])
-            return in_degree + out_degree 
+            return self.get_in_degree(vertex) + len(self.adjacency_list[vertex])
         else:
             degree = len(self.adjacency_list[vertex])
             if vertex in self.adjacency_list[vertex]: 
@@ -106,34 +188,3 @@ if __name__ == '__main__':
     print(f"Degree of 2 (In+Out): {g_dir.get_degree(2)}") 
     print(f"Weight 1->2: {g_dir.get_edge_weight(1, 2)}")
     print(f"Weight 2->1: {g_dir.get_edge_weight(2, 1)}")
-    print("--- Undirected Graph ---")
-    print(g_undir)
-    print(f"Vertices: {g_undir.get_vertices()}")
-    print(f"Edges: {g_undir.get_edges()}")
-    print(f"Neighbors of A: {g_undir.get_neighbors('A')}")
-    print(f"Degree of A: {g_undir.get_degree('A')}") 
-    print(f"Degree of C: {g_undir.get_degree('C')}") 
-    print(f"Weight A-B: {g_undir.get_edge_weight('A', 'B')}")
-    print(f"Weight B-A: {g_undir.get_edge_weight('B', 'A')}")
-    print(f"Weight A-C: {g_undir.get_edge_weight('A', 'C')}") 
-    print(f"Weight A-D: {g_undir.get_edge_weight('A', 'D')}") 
-
-    g_dir = Graph(directed=True)
-    g_dir.add_vertex(1)
-    g_dir.add_vertex(2)
-    g_dir.add_vertex(3)
-    g_dir.add_edge(1, 2, weight=10)
-    g_dir.add_edge(2, 3)
-    g_dir.add_edge(3, 1)
-    g_dir.add_edge(1, 1, weight=5) 
-
-    print("\n--- Directed Graph ---")
-    print(g_dir)
-    print(f"Vertices: {g_dir.get_vertices()}")
-    print(f"Edges: {g_dir.get_edges()}")
-    print(f"Neighbors of 1 (Out): {g_dir.get_neighbors(1)}")
-    print(f"Degree of 1 (In+Out): {g_dir.get_degree(1)}") 
-    print(f"Degree of 2 (In+Out): {g_dir.get_degree(2)}") 
-    print(f"Weight 1->2: {g_dir.get_edge_weight(1, 2)}")
-    print(f"Weight 2->1: {g_dir.get_edge_weight(2, 1)}")
-    print(f"Weight 2->1: {g_dir.get_edge_weight(2, 1)}") # Expect None
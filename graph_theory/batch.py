@@ -0,0 +1,183 @@
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from .algorithms import (_adjacency, bellman_ford, breadth_first_search, chromatic_number, critical_path,
+                         dag_longest_path, depth_first_search, dijkstra, eulerian_circuit, eulerian_path,
+                         find_connected_components, greedy_colouring, hamiltonian_cycle, hamiltonian_path, has_cycle,
+                         has_cycle_undirected, kruskal_mst, shortest_path, strongly_connected_components,
+                         topological_sort)
+from .centrality import betweenness_centrality, closeness_centrality, harmonic_centrality, pagerank
+from .csr import as_csr
+from .flow import max_flow_min_cut
+from .matching import check_bipartite, hopcroft_karp
+from .triangles import clustering, core_numbers, triangle_counts
+
+_worker_graph = None
+
+# Every query key an operation below reads, with the JSON type it expects.
+# Request schemas are built from this, so new options must be listed here.
+QUERY_OPTIONS = {
+    'start_node': object,
+    'end_node': object,
+    'max_distance': float,
+    'k': int,
+    'method': str,
+    'durations': dict,
+    'left': list,
+    'damping': float,
+    'weighted': bool,
+    'seed': int,
+    'strategy': str,
+    'exact': bool,
+    'circuit': bool,
+    'cycle': bool,
+}
+
+
+def _has_cycle(graph, query):
+    return has_cycle(graph) if graph.directed else has_cycle_undirected(graph)
+
+
+def _kruskal(graph, query):
+    mst_edges, total_weight = kruskal_mst(graph)
+    return {'edges': mst_edges, 'total_weight': total_weight}
+
+
+def _dijkstra(graph, query):
+    distances, predecessors = dijkstra(graph, query.get('start_node'), target=query.get('end_node'),
+                                       max_distance=query.get('max_distance'), k=query.get('k'))
+    return {'distances': distances, 'predecessors': predecessors}
+
+
+def _bellman_ford(graph, query):
+    distances, predecessors = bellman_ford(graph, query.get('start_node'))
+    return {'distances': distances, 'predecessors': predecessors}
+
+
+def _shortest_path(graph, query):
+    distance, path = shortest_path(graph, query.get('start_node'), query.get('end_node'))
+    return {'distance': distance if path else None, 'path': path}
+
+
+def _dag_longest_path(graph, query):
+    length, path = dag_longest_path(graph)
+    return {'length': length, 'path': path}
+
+
+def _max_flow(graph, query):
+    value, flows, (source_side, sink_side), cut_edges = max_flow_min_cut(
+        graph, query.get('start_node'), query.get('end_node'), query.get('method', 'dinic'))
+    return {'value': value, 'flows': [[u, v, f] for (u, v), f in flows.items()],
+            'source_side': source_side, 'sink_side': sink_side, 'cut_edges': cut_edges}
+
+
+def _bipartite(graph, query):
+    bipartite, witness = check_bipartite(graph)
+    if bipartite:
+        return {'bipartite': True, 'colouring': [[v, c] for v, c in witness.items()]}
+    return {'bipartite': False, 'odd_cycle': witness}
+
+
+def _maximum_matching(graph, query):
+    return [[u, v] for u, v in hopcroft_karp(graph, query.get('left')).items()]
+
+
+def _colouring(graph, query):
+    if query.get('exact'):
+        colours, colouring = chromatic_number(graph)
+    else:
+        colouring = greedy_colouring(graph, query.get('strategy', 'dsatur'))
+        colours = max(colouring.values(), default=-1) + 1
+    return {'colours': colours, 'colouring': [[v, c] for v, c in colouring.items()]}
+
+
+GRAPH_OPERATIONS = {
+    'dfs': lambda graph, query: depth_first_search(graph, query.get('start_node')),
+    'bfs': lambda graph, query: breadth_first_search(graph, query.get('start_node')),
+    'connected_components': lambda graph, query: find_connected_components(graph),
+    'strongly_connected_components': lambda graph, query: strongly_connected_components(graph),
+    'has_cycle': _has_cycle,
+    'kruskal': _kruskal,
+    'dijkstra': _dijkstra,
+    'bellman_ford': _bellman_ford,
+    'shortest_path': _shortest_path,
+    'topological_sort': lambda graph, query: topological_sort(graph, query.get('method', 'kahn')),
+    'dag_longest_path': _dag_longest_path,
+    'critical_path': lambda graph, query: critical_path(graph, query.get('durations')),
+    'max_flow': _max_flow,
+    'bipartite': _bipartite,
+    'maximum_matching': _maximum_matching,
+    'pagerank': lambda graph, query: pagerank(graph, query.get('damping', 0.85), weighted=query.get('weighted', False)),
+    'betweenness': lambda graph, query: betweenness_centrality(graph, weighted=query.get('weighted', False),
+                                                               k=query.get('k'), seed=query.get('seed'), processes=1),
+    'closeness': lambda graph, query: closeness_centrality(graph, weighted=query.get('weighted', False), processes=1),
+    'colouring': _colouring,
+    'harmonic': lambda graph, query: harmonic_centrality(graph, weighted=query.get('weighted', False), processes=1),
+    'triangles': lambda graph, query: triangle_counts(graph),
+    'clustering': lambda graph, query: clustering(graph),
+    'core_numbers': lambda graph, query: core_numbers(graph),
+    'eulerian': lambda graph, query: (eulerian_circuit if query.get('circuit') else eulerian_path)(graph),
+    'hamiltonian': lambda graph, query: (hamiltonian_cycle if query.get('cycle') else hamiltonian_path)(graph),
+}
+
+
+def prepare(graph):
+    csr = as_csr(graph)
+    _adjacency(csr)
+    csr.reverse()
+    return csr
+
+
+def run_query(graph, query):
+    operation = query.get('operation')
+    if operation not in GRAPH_OPERATIONS:
+        raise ValueError(f"Unknown operation '{operation}'")
+    return GRAPH_OPERATIONS[operation](graph, query)
+
+
+def _run_indexed(graph, indexed_queries):
+    results = []
+    for index, query in indexed_queries:
+        try:
+            results.append({'index': index, 'result': run_query(graph, query)})
+        except Exception as e:
+            results.append({'index': index, 'error': str(e)})
+    return results
+
+
+def _init_worker(csr):
+    global _worker_graph
+    _worker_graph = prepare(csr)
+
+
+def _worker_run(indexed_queries):
+    return _run_indexed(_worker_graph, indexed_queries)
+
+
+def run_batch(graph, queries, processes=1, chunk_size=16):
+    csr = prepare(graph)
+    indexed = list(enumerate(queries))
+    # A pool only pays for itself once every worker gets a few chunks.
+    if processes <= 1 or len(indexed) < 4 * chunk_size:
+        for item in indexed:
+            yield from _run_indexed(csr, [item])
+        return
+
+    with ProcessPoolExecutor(max_workers=processes, initializer=_init_worker, initargs=(csr,)) as pool:
+        futures = [pool.submit(_worker_run, indexed[start:start + chunk_size])
+                   for start in range(0, len(indexed), chunk_size)]
+        for future in as_completed(futures):
+            yield from future.result()
+
+
+if __name__ == '__main__':
+    from .basics import Graph
+
+    g = Graph()
+    g.add_edge('A', 'B', 4)
+    g.add_edge('A', 'C', 2)
+    g.add_edge('C', 'D', 3)
+    queries = [{'operation': 'bfs', 'start_node': v} for v in g.get_vertices()]
+    queries.append({'operation': 'shortest_path', 'start_node': 'B', 'end_node': 'D'})
+    queries.append({'operation': 'unknown'})
+    for line in run_batch(g, queries):
+        print(line)
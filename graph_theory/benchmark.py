@@ -0,0 +1,273 @@
+import argparse
+import contextlib
+import io
+import json
+import math
+import platform
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+from . import algorithms, centrality, flow, triangles
+from .csr import CSRGraph
+from .generators import barabasi_albert, erdos_renyi, grid, random_dag, random_geometric
+
+DEFAULT_SIZES = (10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6)
+
+# Each generator maps a target edge count to a graph with roughly that many
+# edges and an average degree of about eight.
+GENERATORS = {
+    'erdos_renyi': lambda m, seed: erdos_renyi(max(2, m // 4), m, seed),
+    'erdos_renyi_directed': lambda m, seed: erdos_renyi(max(2, m // 4), m, seed, directed=True),
+    'barabasi_albert': lambda m, seed: barabasi_albert(max(5, m // 4), 4, seed),
+    'grid': lambda m, seed: grid(int(math.sqrt(m / 2)) + 1, int(math.sqrt(m / 2)) + 1, seed),
+    'random_dag': lambda m, seed: random_dag(max(2, m // 4), m, seed),
+    'random_geometric': lambda m, seed: random_geometric(max(2, m // 4), math.sqrt(32 / (math.pi * m)), seed),
+}
+
+DAG_GENERATORS = {'random_dag'}
+
+# Vertex counts for the exponential searches, which run on a bounded piece of
+# each graph so every size finishes; their scaling exponents stay near zero.
+HAMILTONIAN_VERTICES = 20
+CHROMATIC_VERTICES = 40
+
+
+def _ball(graph, size):
+    # The first `size` vertices a BFS from vertex 0 reaches, as their own graph.
+    offsets, targets = graph.offsets, graph.targets
+    order, seen = [0], {0}
+    for u in order:
+        for v in targets[offsets[u]:offsets[u + 1]].tolist():
+            if len(order) == size:
+                break
+            if v not in seen:
+                seen.add(v)
+                order.append(v)
+    ids = np.full(graph.num_vertices, -1, dtype=np.int64)
+    ids[order] = np.arange(len(order))
+    sources, targets = ids[graph.sources()], ids[targets]
+    keep = (sources >= 0) & (targets >= 0)
+    return CSRGraph.from_arrays(sources[keep], targets[keep], num_vertices=len(order), directed=graph.directed)
+
+
+def _eulerian_instance(graph):
+    # Every arc in the component of vertex 0 plus its reverse, so each vertex is
+    # balanced and Hierholzer has to walk the whole component.
+    sources, targets = graph.sources(), graph.targets
+    labels = np.asarray(algorithms.weakly_connected_component_labels(graph)[1])
+    keep = labels[sources] == labels[0]
+    sources, targets = sources[keep], targets[keep]
+    return CSRGraph.from_arrays(np.concatenate((sources, targets)), np.concatenate((targets, sources)),
+                                num_vertices=graph.num_vertices, directed=True)
+
+# name -> (callable on a CSR graph, which graphs it applies to)
+BENCHMARKS = {
+    'depth_first_search': (lambda g: algorithms.depth_first_search(g, 0), 'any'),
+    'breadth_first_search': (lambda g: algorithms.breadth_first_search(g, 0), 'any'),
+    'dfs_times': (algorithms.dfs_times, 'any'),
+    'classify_edges': (algorithms.classify_edges, 'any'),
+    'connected_components': (algorithms.find_connected_components, 'undirected'),
+    'weakly_connected_components': (algorithms.weakly_connected_components, 'directed'),
+    'strongly_connected_components': (algorithms.strongly_connected_components, 'directed'),
+    'has_cycle': (algorithms.has_cycle, 'any'),
+    'kruskal_mst': (algorithms.kruskal_mst, 'undirected'),
+    'dijkstra': (lambda g: algorithms.dijkstra(g, 0), 'any'),
+    'multi_source_dijkstra': (lambda g: algorithms.multi_source_dijkstra(g, [0, g.num_vertices // 2, g.num_vertices - 1]),
+                              'any'),
+    'bidirectional_dijkstra': (lambda g: algorithms.bidirectional_dijkstra(g, 0, g.num_vertices - 1), 'any'),
+    'bellman_ford': (lambda g: algorithms.bellman_ford(g, 0), 'any'),
+    'bellman_ford_arrays': (lambda g: algorithms.bellman_ford_arrays(g.sources(), g.targets, g.weights, g.num_vertices, [0]),
+                            'any'),
+    'find_negative_cycle': (algorithms.find_negative_cycle, 'any'),
+    'spfa': (lambda g: algorithms.spfa(g, 0), 'any'),
+    'topological_sort': (algorithms.topological_sort, 'dag'),
+    'dag_longest_path': (algorithms.dag_longest_path, 'dag'),
+    'critical_path': (algorithms.critical_path, 'dag'),
+    'greedy_colouring': (lambda g: algorithms.greedy_colouring(g, 'dsatur'), 'any'),
+    'chromatic_number': (lambda g: algorithms.chromatic_number(_ball(g, CHROMATIC_VERTICES)), 'any'),
+    'eulerian_circuit': (lambda g: algorithms.eulerian_circuit(_eulerian_instance(g)), 'any'),
+    'hamiltonian_path': (lambda g: algorithms.hamiltonian_path(_ball(g, HAMILTONIAN_VERTICES)), 'any'),
+    'max_flow_dinic': (lambda g: flow.max_flow(g, 0, g.num_vertices - 1, 'dinic'), 'any'),
+    'max_flow_push_relabel': (lambda g: flow.max_flow(g, 0, g.num_vertices - 1, 'push_relabel'), 'any'),
+    'pagerank': (centrality.pagerank, 'any'),
+    # 64 sampled sources keep betweenness linear; the exact form is all-pairs like closeness.
+    'betweenness_centrality': (lambda g: centrality.betweenness_centrality(g, k=64, seed=0, processes=1), 'any'),
+    'closeness_centrality': (lambda g: centrality.closeness_centrality(g, processes=1), 'any'),
+    'harmonic_centrality': (lambda g: centrality.harmonic_centrality(g, processes=1), 'any'),
+    'triangle_count': (triangles.triangle_count, 'any'),
+    'clustering': (triangles.clustering, 'any'),
+    'core_numbers': (triangles.core_numbers, 'any'),
+}
+
+
+def _applies(scope, generator, graph):
+    if scope == 'any':
+        return True
+    if scope == 'dag':
+        return generator in DAG_GENERATORS
+    return graph.directed == (scope == 'directed')
+
+
+def _fresh(csr):
+    # Share the arrays but drop derived caches so every run pays its own setup.
+    return CSRGraph(csr.offsets, csr.targets, csr.weights, None, csr.directed)
+
+
+def measure(function, csr, repeat=3, memory=True):
+    times = []
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(repeat):
+            graph = _fresh(csr)
+            start = time.perf_counter()
+            function(graph)
+            times.append(time.perf_counter() - start)
+            if times[-1] > 1.0:
+                break
+        peak = None
+        if memory:
+            graph = _fresh(csr)
+            tracemalloc.start()
+            try:
+                function(graph)
+                peak = tracemalloc.get_traced_memory()[1]
+            finally:
+                tracemalloc.stop()
+    return min(times), peak
+
+
+def scaling_exponent(edges, seconds):
+    points = [(math.log(m), math.log(t)) for m, t in zip(edges, seconds) if m > 0 and t > 0]
+    if len(points) < 2:
+        return None
+    x, y = zip(*points)
+    return float(np.polyfit(x, y, 1)[0])
+
+
+def run_benchmarks(sizes=DEFAULT_SIZES, names=None, generators=None, seed=0, repeat=3, memory=True,
+                   time_limit=60.0, progress=None):
+    names = list(BENCHMARKS) if names is None else names
+    generators = list(GENERATORS) if generators is None else generators
+    for name in names:
+        if name not in BENCHMARKS:
+            raise ValueError(f"Unknown benchmark '{name}'")
+    for generator in generators:
+        if generator not in GENERATORS:
+            raise ValueError(f"Unknown generator '{generator}'")
+
+    results = []
+    too_slow = set()
+    for generator in generators:
+        for size in sorted(sizes):
+            csr = GENERATORS[generator](size, seed)
+            for name in names:
+                function, scope = BENCHMARKS[name]
+                if not _applies(scope, generator, csr) or (name, generator) in too_slow:
+                    continue
+                seconds, peak = measure(function, csr, repeat, memory)
+                # Larger sizes of a case that already blew the budget are skipped.
+                if time_limit is not None and seconds > time_limit:
+                    too_slow.add((name, generator))
+                entry = {'algorithm': name, 'generator': generator, 'size': size, 'vertices': csr.num_vertices,
+                         'edges': csr.num_edges, 'seconds': seconds, 'peak_bytes': peak}
+                results.append(entry)
+                if progress is not None:
+                    progress(entry)
+
+    scaling = {}
+    for name in names:
+        for generator in generators:
+            runs = [r for r in results if r['algorithm'] == name and r['generator'] == generator]
+            exponent = scaling_exponent([r['edges'] for r in runs], [r['seconds'] for r in runs])
+            if exponent is not None:
+                scaling[f"{name}/{generator}"] = exponent
+
+    return {
+        'meta': {'python': platform.python_version(), 'numpy': np.__version__, 'platform': platform.platform(),
+                 'seed': seed, 'sizes': sorted(sizes), 'created': time.strftime('%Y-%m-%dT%H:%M:%S')},
+        'results': results,
+        'scaling': scaling,
+    }
+
+
+def compare(report, baseline, tolerance=0.25, min_seconds=0.005, exponent_tolerance=0.15):
+    previous = {(r['algorithm'], r['generator'], r['size']): r for r in baseline.get('results', [])}
+    regressions = []
+    for result in report['results']:
+        old = previous.get((result['algorithm'], result['generator'], result['size']))
+        if old is None:
+            continue
+        # Tiny timings are mostly noise; require both a relative and an absolute slowdown.
+        if result['seconds'] > old['seconds'] * (1 + tolerance) and result['seconds'] - old['seconds'] > min_seconds:
+            regressions.append({'kind': 'time', 'algorithm': result['algorithm'], 'generator': result['generator'],
+                                'size': result['size'], 'baseline': old['seconds'], 'current': result['seconds'],
+                                'ratio': result['seconds'] / old['seconds']})
+    for key, exponent in report['scaling'].items():
+        old = baseline.get('scaling', {}).get(key)
+        if old is not None and exponent > old + exponent_tolerance:
+            algorithm, generator = key.split('/')
+            regressions.append({'kind': 'scaling', 'algorithm': algorithm, 'generator': generator,
+                                'baseline': old, 'current': exponent})
+    return regressions
+
+
+def _format_bytes(value):
+    if value is None:
+        return '-'
+    for unit in ('B', 'KiB', 'MiB', 'GiB'):
+        if value < 1024 or unit == 'GiB':
+            return f"{value:.0f}{unit}" if unit == 'B' else f"{value:.1f}{unit}"
+        value /= 1024
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m graph_theory.benchmark',
+                                     description='Time graph_theory.algorithms on seeded synthetic graphs.')
+    parser.add_argument('--sizes', type=int, nargs='+', default=list(DEFAULT_SIZES), help='target edge counts')
+    parser.add_argument('--algorithms', nargs='+', choices=list(BENCHMARKS), help='subset of algorithms')
+    parser.add_argument('--generators', nargs='+', choices=list(GENERATORS), help='subset of generators')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--repeat', type=int, default=3, help='timed runs per case (best is kept)')
+    parser.add_argument('--no-memory', action='store_true', help='skip the tracemalloc peak-memory run')
+    parser.add_argument('--time-limit', type=float, default=60.0, help='skip larger sizes once a case exceeds this')
+    parser.add_argument('--output', default='bench_results.json', help='where to write the JSON report')
+    parser.add_argument('--baseline', help='JSON report to compare against')
+    parser.add_argument('--tolerance', type=float, default=0.25, help='allowed relative slowdown')
+    parser.add_argument('--update-baseline', action='store_true', help='overwrite --baseline with this run')
+    args = parser.parse_args(argv)
+
+    def progress(entry):
+        print(f"{entry['algorithm']:<30} {entry['generator']:<22} {entry['edges']:>9} edges "
+              f"{entry['seconds'] * 1000:>10.2f} ms {_format_bytes(entry['peak_bytes']):>10}", flush=True)
+
+    report = run_benchmarks(args.sizes, args.algorithms, args.generators, args.seed, args.repeat,
+                            not args.no_memory, args.time_limit, progress)
+    print("\nScaling exponents (time ~ edges^k):")
+    for key, exponent in sorted(report['scaling'].items()):
+        print(f"  {key:<52} {exponent:5.2f}")
+
+    status = 0
+    if args.baseline and not args.update_baseline:
+        with open(args.baseline) as f:
+            regressions = compare(report, json.load(f), args.tolerance)
+        report['regressions'] = regressions
+        for r in regressions:
+            where = f"{r['algorithm']}/{r['generator']}" + (f" @ {r['size']} edges" if 'size' in r else '')
+            print(f"REGRESSION ({r['kind']}) {where}: {r['baseline']:.4g} -> {r['current']:.4g}")
+        if regressions:
+            status = 1
+        else:
+            print("No regressions against baseline.")
+
+    with open(args.output, 'w') as f:
+        json.dump(report, f, indent=2)
+    if args.baseline and args.update_baseline:
+        with open(args.baseline, 'w') as f:
+            json.dump(report, f, indent=2)
+    return status
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,248 @@
+import heapq
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from .algorithms import NEGATIVE_WEIGHTS, _adjacency, _dijkstra_ids, _dijkstra_weights, _negative_tails, _numeric_weights
+from .csr import as_csr
+
+# Below this many edge visits (sources x arcs) a process pool costs more than it saves.
+_PARALLEL_WORK = 20_000_000
+
+_worker_graph = None
+
+
+def _init_worker(csr):
+    global _worker_graph
+    _worker_graph = csr
+
+
+def _run_chunk(job):
+    kernel, sources, options = job
+    return kernel(_worker_graph, sources, *options)
+
+
+def _map_sources(csr, kernel, sources, options, processes):
+    sources = list(sources)
+    if processes is None:
+        processes = os.cpu_count() if len(sources) * len(csr.targets) >= _PARALLEL_WORK else 1
+    if processes <= 1 or len(sources) < 2:
+        return [kernel(csr, sources, *options)]
+    chunk_size = -(-len(sources) // (4 * processes))
+    jobs = [(kernel, sources[start:start + chunk_size], options) for start in range(0, len(sources), chunk_size)]
+    with ProcessPoolExecutor(max_workers=processes, initializer=_init_worker, initargs=(csr,)) as pool:
+        return list(pool.map(_run_chunk, jobs))
+
+
+def pagerank(graph, damping=0.85, tol=1e-6, max_iter=100, weighted=False, personalization=None):
+    csr = as_csr(graph)
+    n = csr.num_vertices
+    if n == 0:
+        return {}
+    sources, targets = csr.sources(), csr.targets
+    weights = _numeric_weights(csr).astype(np.float64) if weighted else np.ones(len(targets))
+    if len(weights) and weights.min() < 0:
+        raise ValueError("PageRank does not support negative edge weights.")
+    out_strength = np.bincount(sources, weights=weights, minlength=n)
+    coefficients = np.divide(weights, out_strength[sources], out=np.zeros(len(weights)), where=out_strength[sources] > 0)
+    dangling = out_strength == 0
+
+    if personalization is None:
+        teleport = np.full(n, 1.0 / n)
+    else:
+        teleport = np.zeros(n)
+        for vertex, value in personalization.items():
+            teleport[csr.vertex_id(vertex)] = value
+        if teleport.sum() <= 0:
+            raise ValueError("Personalization must have a positive total.")
+        teleport /= teleport.sum()
+
+    # Power iteration; rank held by dangling vertices is redistributed like a teleport.
+    rank = np.full(n, 1.0 / n)
+    for _ in range(max_iter):
+        previous = rank
+        spread = np.bincount(targets, weights=previous[sources] * coefficients, minlength=n)
+        rank = damping * (spread + previous[dangling].sum() * teleport) + (1 - damping) * teleport
+        if np.abs(rank - previous).sum() < n * tol:
+            break
+    else:
+        raise ValueError(f"PageRank did not converge within {max_iter} iterations.")
+
+    return dict(zip(csr.labels, rank.tolist()))
+
+
+def _frontier_arcs(offsets, targets, frontier):
+    starts = offsets[frontier]
+    counts = offsets[frontier + 1] - starts
+    total = int(counts.sum())
+    positions = np.arange(total) + np.repeat(starts - np.cumsum(counts) + counts, counts)
+    return np.repeat(frontier, counts), targets[positions]
+
+
+def _bfs_levels(csr, source):
+    # Level-synchronous BFS: one round of array operations per distance layer.
+    offsets, targets = csr.offsets, csr.targets
+    dist = np.full(csr.num_vertices, -1, dtype=np.int64)
+    dist[source] = 0
+    frontier = np.array([source], dtype=np.int64)
+    level = 0
+    while len(frontier):
+        parents, children = _frontier_arcs(offsets, targets, frontier)
+        fresh = children[dist[children] < 0]
+        dist[fresh] = level + 1
+        yield level, frontier, parents, children, dist
+        level += 1
+        frontier = np.unique(fresh)
+
+
+def _betweenness_chunk(csr, sources, weighted):
+    n = csr.num_vertices
+    if weighted:
+        offsets, targets = _adjacency(csr)
+        reverse = csr.reverse()
+        reverse_offsets, reverse_targets = _adjacency(reverse)
+        weights = csr.derived('dijkstra_weights', _dijkstra_weights)
+        reverse_weights = reverse.derived('dijkstra_weights', _dijkstra_weights)
+        negative = csr.derived('negative_tails', _negative_tails)
+    totals = np.zeros(n)
+
+    for s in sources:
+        if not weighted:
+            sigma = np.zeros(n)
+            sigma[s] = 1
+            layers = []
+            for level, _, parents, children, dist in _bfs_levels(csr, s):
+                on_path = dist[children] == level + 1
+                parents, children = parents[on_path], children[on_path]
+                np.add.at(sigma, children, sigma[parents])
+                layers.append((parents, children))
+            # Dependencies flow back over the shortest-path DAG one layer at a time.
+            delta = np.zeros(n)
+            for parents, children in reversed(layers):
+                np.add.at(delta, parents, sigma[parents] / sigma[children] * (1 + delta[children]))
+            delta[s] = 0
+            totals += delta
+        else:
+            sigma = [0] * n
+            sigma[s] = 1
+            delta = [0.0] * n
+            dist = {s: 0}
+            settled = {}
+            order = []
+            heap = [(0, s)]
+            while heap:
+                d, v = heapq.heappop(heap)
+                if v in settled:
+                    continue
+                if v in negative:
+                    raise ValueError(NEGATIVE_WEIGHTS)
+                settled[v] = d
+                order.append(v)
+                for k in range(offsets[v], offsets[v + 1]):
+                    w = targets[k]
+                    candidate = d + weights[k]
+                    if w in settled:
+                        continue
+                    known = dist.get(w)
+                    if known is None or candidate < known:
+                        dist[w] = candidate
+                        sigma[w] = sigma[v]
+                        heapq.heappush(heap, (candidate, w))
+                    elif candidate == known:
+                        sigma[w] += sigma[v]
+            for w in reversed(order):
+                coefficient = (1 + delta[w]) / sigma[w]
+                target_dist = settled[w]
+                for k in range(reverse_offsets[w], reverse_offsets[w + 1]):
+                    v = reverse_targets[k]
+                    if v in settled and v != w and settled[v] + reverse_weights[k] == target_dist:
+                        delta[v] += sigma[v] * coefficient
+                if w != s:
+                    totals[w] += delta[w]
+
+    return totals
+
+
+def betweenness_centrality(graph, normalized=True, weighted=False, k=None, seed=None, processes=None):
+    csr = as_csr(graph)
+    n = csr.num_vertices
+    if k is None or k >= n:
+        sources = range(n)
+        sample_scale = 1.0
+    else:
+        # Sampled (Brandes-Pich) estimate: k random pivots, scaled back up.
+        sources = np.random.default_rng(seed).choice(n, size=k, replace=False).tolist()
+        sample_scale = n / k
+
+    totals = np.zeros(n)
+    for partial in _map_sources(csr, _betweenness_chunk, sources, (weighted,), processes):
+        totals += partial
+
+    if normalized:
+        scale = 1.0 / ((n - 1) * (n - 2)) if n > 2 else 1.0
+    else:
+        scale = 1.0 if csr.directed else 0.5
+    return dict(zip(csr.labels, (totals * scale * sample_scale).tolist()))
+
+
+def _distance_chunk(csr, sources, weighted):
+    # Distances *to* each source: `csr` is the reversed graph for directed input.
+    rows = []
+    for s in sources:
+        if weighted:
+            distances = list(_dijkstra_ids(csr, [s])[0].values())
+            rows.append((s, len(distances), sum(distances), sum(1 / d for d in distances if d > 0)))
+        else:
+            reached = total = 0
+            harmonic = 0.0
+            for level, frontier, _, _, _ in _bfs_levels(csr, s):
+                reached += len(frontier)
+                total += level * len(frontier)
+                if level:
+                    harmonic += len(frontier) / level
+            rows.append((s, reached, total, harmonic))
+    return rows
+
+
+def _distance_summaries(graph, weighted, processes):
+    csr = as_csr(graph)
+    reverse = csr.reverse()
+    chunks = _map_sources(reverse, _distance_chunk, range(csr.num_vertices), (weighted,), processes)
+    return csr, [row for chunk in chunks for row in chunk]
+
+
+def closeness_centrality(graph, weighted=False, wf_improved=True, processes=None):
+    csr, rows = _distance_summaries(graph, weighted, processes)
+    n = csr.num_vertices
+    labels = csr.labels
+    closeness = {}
+    for s, reached, total, _ in rows:
+        value = 0.0
+        if total > 0 and n > 1:
+            value = (reached - 1) / total
+            if wf_improved:
+                # Wasserman-Faust: scale by the fraction of the graph that is reachable.
+                value *= (reached - 1) / (n - 1)
+        closeness[labels[s]] = value
+    return closeness
+
+
+def harmonic_centrality(graph, weighted=False, processes=None):
+    csr, rows = _distance_summaries(graph, weighted, processes)
+    labels = csr.labels
+    return {labels[s]: harmonic for s, _, _, harmonic in rows}
+
+
+if __name__ == '__main__':
+    from .basics import Graph
+
+    g = Graph(directed=True)
+    for u, v in [('A', 'B'), ('B', 'C'), ('C', 'A'), ('A', 'D'), ('D', 'C'), ('E', 'A')]:
+        g.add_edge(u, v)
+
+    print(f"PageRank: {pagerank(g)}")
+    print(f"Betweenness: {betweenness_centrality(g)}")
+    print(f"Sampled betweenness (k=3): {betweenness_centrality(g, k=3, seed=0)}")
+    print(f"Closeness: {closeness_centrality(g)}")
+    print(f"Harmonic: {harmonic_centrality(g)}")
@@ -0,0 +1,76 @@
+from .algorithms import DSU
+
+
+class ConnectivityIndex:
+    def __init__(self, graph):
+        self.graph = graph
+        self._dsu = None
+        self._stale = True
+        graph.add_observer(self)
+
+    def detach(self):
+        self.graph.remove_observer(self)
+
+    def _rebuild(self):
+        dsu = DSU(self.graph.get_vertices())
+        for vertex, neighbors in self.graph.adjacency_list.items():
+            for neighbor in neighbors:
+                dsu.union(vertex, neighbor)
+        self._dsu = dsu
+        self._stale = False
+
+    def _index(self):
+        if self._stale:
+            self._rebuild()
+        return self._dsu
+
+    def on_vertex_added(self, vertex):
+        if not self._stale:
+            self._dsu.add(vertex)
+
+    def on_edge_added(self, start, end, weight):
+        if not self._stale:
+            self._dsu.union(start, end)
+
+    def on_edge_removed(self, start, end):
+        self._stale = True
+
+    def on_vertex_removed(self, vertex):
+        self._stale = True
+
+    def _check(self, vertex):
+        if vertex not in self.graph.adjacency_list:
+            raise ValueError(f"Vertex '{vertex}' not in graph")
+
+    def connected(self, u, v):
+        self._check(u)
+        self._check(v)
+        return self._index().connected(u, v)
+
+    def component_size(self, vertex):
+        self._check(vertex)
+        return self._index().component_size(vertex)
+
+    def component_count(self):
+        return self._index().count
+
+
+if __name__ == '__main__':
+    from .basics import Graph
+
+    g = Graph()
+    index = ConnectivityIndex(g)
+    g.add_edge('A', 'B')
+    g.add_edge('C', 'D')
+    g.add_vertex('E')
+    print(f"A~B? {index.connected('A', 'B')}")
+    print(f"A~C? {index.connected('A', 'C')}")
+    print(f"Components: {index.component_count()}")
+
+    g.add_edge('B', 'C')
+    print(f"A~D after B-C? {index.connected('A', 'D')}")
+    print(f"Size of A's component: {index.component_size('A')}")
+
+    g.remove_edge('B', 'C')
+    print(f"A~D after removing B-C? {index.connected('A', 'D')}")
+    print(f"Components: {index.component_count()}")
@@ -0,0 +1,267 @@
+import numpy as np
+
+from .basics import Graph
+
+_INDEX_DTYPE = np.int64
+
+
+def _id_dtype(num_vertices):
+    return np.int32 if num_vertices < 2 ** 31 else np.int64
+
+
+def _weight_array(values):
+    if all(w is None or isinstance(w, (int, float)) for w in values):
+        return np.array(values, dtype=np.float64).reshape(-1)
+    weights = np.empty(len(values), dtype=object)
+    weights[:] = values
+    return weights
+
+
+class CSRGraph:
+    __slots__ = ('directed', 'offsets', 'targets', 'weights', 'labels', '_index', '_derived')
+
+    def __init__(self, offsets, targets, weights=None, labels=None, directed=False):
+        offsets = np.ascontiguousarray(offsets, dtype=_INDEX_DTYPE)
+        num_vertices = len(offsets) - 1
+        targets = np.ascontiguousarray(targets, dtype=_id_dtype(num_vertices))
+        if weights is None:
+            weights = np.broadcast_to(np.float64(np.nan), (len(targets),))
+        elif not isinstance(weights, np.ndarray) or weights.dtype != object:
+            weights = np.ascontiguousarray(weights, dtype=np.float64)
+        if num_vertices < 0 or offsets[0] != 0 or offsets[-1] != len(targets):
+            raise ValueError("Offsets do not describe the target array")
+        if len(weights) != len(targets):
+            raise ValueError("Weights and targets must have the same length")
+        if labels is not None and len(labels) != num_vertices:
+            raise ValueError("Expected one label per vertex")
+        for arr in (offsets, targets, weights):
+            arr.flags.writeable = False
+
+        set_attr = object.__setattr__
+        set_attr(self, 'directed', directed)
+        set_attr(self, 'offsets', offsets)
+        set_attr(self, 'targets', targets)
+        set_attr(self, 'weights', weights)
+        set_attr(self, '_derived', {})
+        if labels is None:
+            set_attr(self, 'labels', range(num_vertices))
+            set_attr(self, '_index', None)
+        else:
+            labels = tuple(labels)
+            index = {label: i for i, label in enumerate(labels)}
+            if len(index) != num_vertices:
+                raise ValueError("Vertex labels must be unique")
+            set_attr(self, 'labels', labels)
+            set_attr(self, '_index', index)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("CSRGraph is immutable")
+
+    def __reduce__(self):
+        labels = None if self._index is None else self.labels
+        return CSRGraph, (self.offsets, self.targets, self.weights, labels, self.directed)
+
+    def derived(self, key, factory):
+        # The arrays never change, so anything computed from them can be kept.
+        if key not in self._derived:
+            self._derived[key] = factory(self)
+        return self._derived[key]
+
+    @classmethod
+    def from_graph(cls, graph):
+        if isinstance(graph, cls):
+            return graph
+        adjacency = graph.adjacency_list
+        labels = list(adjacency)
+        index = {label: i for i, label in enumerate(labels)}
+        offsets = np.zeros(len(labels) + 1, dtype=_INDEX_DTYPE)
+        np.cumsum([len(neighbors) for neighbors in adjacency.values()], out=offsets[1:])
+        targets = np.fromiter(
+            (index[u] for neighbors in adjacency.values() for u in neighbors),
+            dtype=_id_dtype(len(labels)), count=int(offsets[-1]))
+        weights = _weight_array([w for neighbors in adjacency.values() for w in neighbors.values()])
+        return cls(offsets, targets, weights, labels, directed=graph.directed)
+
+    @classmethod
+    def from_edges(cls, edges, directed=False, vertices=None):
+        index = {}
+        if vertices is not None:
+            for v in vertices:
+                index.setdefault(v, len(index))
+        src, dst, weights = [], [], []
+        for edge in edges:
+            u, v = edge[0], edge[1]
+            src.append(index.setdefault(u, len(index)))
+            dst.append(index.setdefault(v, len(index)))
+            weights.append(edge[2] if len(edge) > 2 else None)
+        return cls.from_arrays(src, dst, _weight_array(weights), num_vertices=len(index),
+                               directed=directed, labels=list(index))
+
+    @classmethod
+    def from_arrays(cls, src, dst, weights=None, num_vertices=None, directed=False, labels=None):
+        src = np.asarray(src, dtype=_INDEX_DTYPE).reshape(-1)
+        dst = np.asarray(dst, dtype=_INDEX_DTYPE).reshape(-1)
+        if len(src) != len(dst):
+            raise ValueError("Source and destination arrays must have the same length")
+        if weights is None:
+            weights = np.full(len(src), np.nan)
+        elif not isinstance(weights, np.ndarray) or weights.dtype != object:
+            weights = np.asarray(weights, dtype=np.float64).reshape(-1)
+        if num_vertices is None:
+            num_vertices = len(labels) if labels is not None else int(max(src.max(initial=-1), dst.max(initial=-1))) + 1
+        if len(src) and (min(src.min(), dst.min()) < 0 or max(src.max(), dst.max()) >= num_vertices):
+            raise ValueError("Edge endpoint out of range")
+
+        if not directed:
+            # Interleave each edge with its reverse so per-vertex neighbour order
+            # matches what repeated Graph.add_edge calls would produce.
+            src, dst = np.column_stack((src, dst)).ravel(), np.column_stack((dst, src)).ravel()
+            weights = np.repeat(weights, 2)
+
+        # Like a dict, keep the first position of a repeated edge and its last weight.
+        keys = src * num_vertices + dst
+        unique_keys, first = np.unique(keys, return_index=True)
+        if len(unique_keys) != len(keys):
+            _, last = np.unique(keys[::-1], return_index=True)
+            last = len(keys) - 1 - last
+            order = np.argsort(first, kind='stable')
+            src, dst, weights = src[first[order]], dst[first[order]], weights[last[order]]
+
+        order = np.argsort(src, kind='stable')
+        targets = dst[order]
+        offsets = np.zeros(num_vertices + 1, dtype=_INDEX_DTYPE)
+        np.cumsum(np.bincount(src, minlength=num_vertices), out=offsets[1:])
+        return cls(offsets, targets, weights[order], labels, directed=directed)
+
+    @property
+    def num_vertices(self):
+        return len(self.offsets) - 1
+
+    @property
+    def num_edges(self):
+        if self.directed:
+            return len(self.targets)
+        loops = int(np.count_nonzero(self.targets == self.sources()))
+        return (len(self.targets) + loops) // 2
+
+    def __len__(self):
+        return self.num_vertices
+
+    def __contains__(self, vertex):
+        if self._index is None:
+            return isinstance(vertex, (int, np.integer)) and 0 <= vertex < self.num_vertices
+        return vertex in self._index
+
+    def vertex_id(self, vertex):
+        if vertex not in self:
+            raise ValueError(f"Vertex '{vertex}' not in graph")
+        return int(vertex) if self._index is None else self._index[vertex]
+
+    def sources(self):
+        return np.repeat(np.arange(self.num_vertices, dtype=self.targets.dtype), np.diff(self.offsets))
+
+    def reverse(self):
+        if not self.directed:
+            return self
+        return self.derived('reverse', _transpose)
+
+    def neighbor_ids(self, vertex_id):
+        return self.targets[self.offsets[vertex_id]:self.offsets[vertex_id + 1]]
+
+    def edge_weight(self, position):
+        weight = self.weights[position]
+        if weight is None or (isinstance(weight, float) and weight != weight):
+            return None
+        if isinstance(weight, np.floating):
+            return int(weight) if weight.is_integer() else float(weight)
+        return weight
+
+    def get_vertices(self):
+        return list(self.labels)
+
+    def get_neighbors(self, vertex):
+        labels = self.labels
+        return [labels[j] for j in self.neighbor_ids(self.vertex_id(vertex)).tolist()]
+
+    def get_edges(self):
+        labels = self.labels
+        edges = []
+        for i, j, position in zip(self.sources().tolist(), self.targets.tolist(), range(len(self.targets))):
+            if not self.directed and i > j:
+                continue
+            weight = self.edge_weight(position)
+            edge = (labels[i], labels[j], weight) if weight is not None else (labels[i], labels[j])
+            edges.append(edge)
+        return edges
+
+    def out_degrees(self):
+        return np.diff(self.offsets)
+
+    def in_degrees(self):
+        return self.derived('in_degrees', lambda c: np.bincount(c.targets, minlength=c.num_vertices))
+
+    def get_degree(self, vertex):
+        i = self.vertex_id(vertex)
+        out_degree = int(self.offsets[i + 1] - self.offsets[i])
+        if self.directed:
+            return out_degree + int(self.in_degrees()[i])
+        return out_degree + int(np.count_nonzero(self.neighbor_ids(i) == i))
+
+    def get_edge_weight(self, start, end):
+        if start not in self or end not in self:
+            return None
+        i, j = self.vertex_id(start), self.vertex_id(end)
+        hits = np.flatnonzero(self.neighbor_ids(i) == j)
+        if not len(hits):
+            return None
+        return self.edge_weight(int(self.offsets[i]) + int(hits[-1]))
+
+    def to_graph(self):
+        graph = Graph(directed=self.directed)
+        labels = self.labels
+        for label in labels:
+            graph.add_vertex(label)
+        for i, j, position in zip(self.sources().tolist(), self.targets.tolist(), range(len(self.targets))):
+            graph.adjacency_list[labels[i]][labels[j]] = self.edge_weight(position)
+        return graph
+
+    def __str__(self):
+        res = f"CSRGraph ({'Directed' if self.directed else 'Undirected'}):\n"
+        res += f" Vertices: {self.num_vertices}\n"
+        res += f" Edges: {self.num_edges}\n"
+        return res
+
+
+def _transpose(csr):
+    order = np.argsort(csr.targets, kind='stable')
+    offsets = np.zeros(csr.num_vertices + 1, dtype=_INDEX_DTYPE)
+    np.cumsum(np.bincount(csr.targets, minlength=csr.num_vertices), out=offsets[1:])
+    labels = None if csr._index is None else csr.labels
+    return CSRGraph(offsets, csr.sources()[order], csr.weights[order], labels, directed=True)
+
+
+def as_csr(graph):
+    if isinstance(graph, CSRGraph):
+        return graph
+    return graph.to_csr()
+
+
+if __name__ == '__main__':
+    g = Graph()
+    g.add_edge('A', 'B', 5)
+    g.add_edge('A', 'C')
+    g.add_edge('B', 'C', 2)
+    g.add_edge('C', 'D')
+
+    csr = CSRGraph.from_graph(g)
+    print(csr)
+    print(f"Offsets: {csr.offsets}")
+    print(f"Targets: {csr.targets}")
+    print(f"Weights: {csr.weights}")
+    print(f"Neighbors of A: {csr.get_neighbors('A')}")
+    print(f"Degree of C: {csr.get_degree('C')}")
+    print(f"Weight A-B: {csr.get_edge_weight('A', 'B')}")
+
+    csr_dir = CSRGraph.from_edges([(1, 2, 10), (2, 3), (3, 1)], directed=True)
+    print(csr_dir)
+    print(f"Edges: {csr_dir.get_edges()}")
@@ -0,0 +1,341 @@
+import numpy as np
+
+from .algorithms import _numeric_weights, _undirected_edge_positions
+from .csr import CSRGraph, as_csr
+
+
+class ResidualGraph:
+    def __init__(self, csr):
+        capacities = _numeric_weights(csr)
+        tails, heads = csr.sources().astype(np.int64), csr.targets.astype(np.int64)
+        if not csr.directed:
+            positions = _undirected_edge_positions(csr)
+            tails, heads, capacities = tails[positions], heads[positions], capacities[positions]
+        if len(capacities) and capacities.min() < 0:
+            raise ValueError("Edge capacities must be non-negative.")
+
+        # Arc 2k is the k-th edge and arc 2k + 1 its reverse, so `arc ^ 1` pairs them.
+        m = len(tails)
+        arc_tails = np.column_stack((tails, heads)).ravel()
+        arc_heads = np.column_stack((heads, tails)).ravel()
+        residual = np.column_stack((capacities, capacities if not csr.directed else np.zeros_like(capacities))).ravel()
+        order = np.argsort(arc_tails, kind='stable')
+        offsets = np.zeros(csr.num_vertices + 1, dtype=np.int64)
+        np.cumsum(np.bincount(arc_tails, minlength=csr.num_vertices), out=offsets[1:])
+
+        self.csr = csr
+        self.num_vertices = csr.num_vertices
+        self.num_edges = m
+        self.offsets = offsets.tolist()
+        self.arcs = order.tolist()
+        self.heads = arc_heads.tolist()
+        self.capacities = residual.tolist()
+        self.residual = list(self.capacities)
+
+    def reachable_to(self, sink):
+        offsets, arcs, heads, residual = self.offsets, self.arcs, self.heads, self.residual
+        # Walk reverse arcs: u reaches v in the residual graph iff arc u->v has capacity left.
+        seen = bytearray(self.num_vertices)
+        seen[sink] = 1
+        queue = [sink]
+        for v in queue:
+            for k in range(offsets[v], offsets[v + 1]):
+                arc = arcs[k]
+                u = heads[arc]
+                if not seen[u] and residual[arc ^ 1] > 0:
+                    seen[u] = 1
+                    queue.append(u)
+        return seen
+
+    def edge_flows(self):
+        labels = self.csr.labels
+        heads, capacities, residual = self.heads, self.capacities, self.residual
+        flows = {}
+        for k in range(self.num_edges):
+            arc = 2 * k
+            amount = capacities[arc] - residual[arc]
+            u, v = heads[arc + 1], heads[arc]
+            if amount > 0:
+                flows[(labels[u], labels[v])] = flows.get((labels[u], labels[v]), 0) + amount
+            elif amount < 0:
+                flows[(labels[v], labels[u])] = flows.get((labels[v], labels[u]), 0) - amount
+        return flows
+
+
+def _dinic(network, source, sink):
+    n = network.num_vertices
+    offsets, arcs, heads, residual = network.offsets, network.arcs, network.heads, network.residual
+    ends = offsets[1:]
+    total = 0
+
+    while True:
+        level = [-1] * n
+        level[source] = 0
+        queue = [source]
+        for v in queue:
+            next_level = level[v] + 1
+            for k in range(offsets[v], ends[v]):
+                arc = arcs[k]
+                w = heads[arc]
+                if level[w] < 0 and residual[arc] > 0:
+                    level[w] = next_level
+                    queue.append(w)
+        if level[sink] < 0:
+            return total
+
+        # Blocking flow with per-vertex current-arc pointers; dead ends are cut
+        # from the level graph and the search resumes below the saturated arc.
+        pointer = offsets[:-1]
+        path = []
+        v = source
+        while True:
+            if v == sink:
+                bottleneck = min(residual[arc] for arc in path)
+                total += bottleneck
+                retreat = None
+                for i, arc in enumerate(path):
+                    residual[arc] -= bottleneck
+                    residual[arc ^ 1] += bottleneck
+                    if retreat is None and residual[arc] == 0:
+                        retreat = i
+                v = heads[path[retreat] ^ 1]
+                del path[retreat:]
+                continue
+
+            k, end, want = pointer[v], ends[v], level[v] + 1
+            while k < end:
+                arc = arcs[k]
+                if residual[arc] > 0 and level[heads[arc]] == want:
+                    break
+                k += 1
+            pointer[v] = k
+            if k < end:
+                path.append(arcs[k])
+                v = heads[arcs[k]]
+            elif v == source:
+                break
+            else:
+                level[v] = -1
+                v = heads[path.pop() ^ 1]
+                pointer[v] += 1
+
+
+def _distance_labels(network, source, sink):
+    # Global relabel: exact residual distance to the sink, or n plus the
+    # distance back to the source for vertices that can no longer reach it.
+    n = network.num_vertices
+    offsets, arcs, heads, residual = network.offsets, network.arcs, network.heads, network.residual
+    height = [2 * n] * n
+    for root, base in ((sink, 0), (source, n)):
+        height[root] = base
+        queue = [root]
+        for v in queue:
+            label = height[v] + 1
+            for k in range(offsets[v], offsets[v + 1]):
+                arc = arcs[k]
+                u = heads[arc]
+                if height[u] == 2 * n and residual[arc ^ 1] > 0:
+                    height[u] = label
+                    queue.append(u)
+    return height
+
+
+def _active_buckets(network, source, sink, excess, limit):
+    n = network.num_vertices
+    height = _distance_labels(network, source, sink)
+    count = [0] * (2 * n + 1)
+    buckets = [[] for _ in range(limit)]
+    for v in range(n):
+        count[height[v]] += 1
+        if excess[v] > 0 and height[v] < limit and v != sink and v != source:
+            buckets[height[v]].append(v)
+    return height, count, buckets
+
+
+def _push_relabel(network, source, sink):
+    n = network.num_vertices
+    offsets, arcs, heads, residual = network.offsets, network.arcs, network.heads, network.residual
+    ends = offsets[1:]
+    excess = [0] * n
+
+    for k in range(offsets[source], ends[source]):
+        arc = arcs[k]
+        amount = residual[arc]
+        if amount > 0:
+            w = heads[arc]
+            residual[arc] = 0
+            residual[arc ^ 1] += amount
+            excess[w] += amount
+
+    # Phase one only discharges vertices below height n, which yields a maximum
+    # preflow (and the cut); phase two then returns the stranded excess to the source.
+    for limit in (n, 2 * n):
+        height, count, buckets = _active_buckets(network, source, sink, excess, limit)
+        highest = limit - 1
+        pointer = offsets[:-1]
+        relabels = 0
+
+        while highest >= 0:
+            if not buckets[highest]:
+                highest -= 1
+                continue
+            v = buckets[highest].pop()
+            if height[v] != highest:
+                # Lifted by a gap relabel after it was queued.
+                if height[v] < limit:
+                    buckets[height[v]].append(v)
+                    highest = height[v]
+                continue
+            # Discharge v: push along admissible arcs, relabel when the arc list runs out.
+            while excess[v] > 0 and height[v] < limit:
+                k = pointer[v]
+                if k == ends[v]:
+                    relabels += 1
+                    if relabels > n // 4:
+                        # Local relabels drift far above the true distances; recompute them.
+                        height, count, buckets = _active_buckets(network, source, sink, excess, limit)
+                        highest = limit - 1
+                        pointer = offsets[:-1]
+                        relabels = 0
+                        break
+                    old = height[v]
+                    new = 2 * n
+                    for k in range(offsets[v], ends[v]):
+                        arc = arcs[k]
+                        if residual[arc] > 0 and height[heads[arc]] + 1 < new:
+                            new = height[heads[arc]] + 1
+                    count[old] -= 1
+                    if count[old] == 0 and old < n:
+                        # Gap heuristic: nothing at height `old` means everything above it
+                        # (and below n) can no longer reach the sink.
+                        for u in range(n):
+                            if old < height[u] < n:
+                                count[height[u]] -= 1
+                                height[u] = n + 1
+                                count[n + 1] += 1
+                        new = max(new, n + 1)
+                    height[v] = new
+                    count[new] += 1
+                    pointer[v] = offsets[v]
+                    continue
+
+                arc = arcs[k]
+                w = heads[arc]
+                if residual[arc] > 0 and height[v] == height[w] + 1:
+                    amount = min(excess[v], residual[arc])
+                    residual[arc] -= amount
+                    residual[arc ^ 1] += amount
+                    excess[v] -= amount
+                    if excess[w] == 0 and w != sink and w != source:
+                        buckets[height[w]].append(w)
+                    excess[w] += amount
+                else:
+                    pointer[v] = k + 1
+            if height[v] < limit:
+                highest = max(highest, height[v] - 1)
+
+    return excess[sink]
+
+
+FLOW_METHODS = {
+    'dinic': _dinic,
+    'push_relabel': _push_relabel,
+}
+
+
+def _solve(graph, source, sink, method):
+    if method not in FLOW_METHODS:
+        raise ValueError(f"Unknown max-flow method '{method}'")
+    csr = as_csr(graph)
+    for node in (source, sink):
+        if node not in graph:
+            raise ValueError(f"Node '{node}' not found in graph.")
+    s, t = csr.vertex_id(source), csr.vertex_id(sink)
+    if s == t:
+        raise ValueError("Source and sink must be different vertices.")
+    network = ResidualGraph(csr)
+    return network, FLOW_METHODS[method](network, s, t), t
+
+
+def _cut(network, sink):
+    sink_side = network.reachable_to(sink)
+    labels = network.csr.labels
+    source_labels = [labels[v] for v in range(network.num_vertices) if not sink_side[v]]
+    sink_labels = [labels[v] for v in range(network.num_vertices) if sink_side[v]]
+    heads = network.heads
+    cut_edges = []
+    for k in range(network.num_edges):
+        u, v = heads[2 * k + 1], heads[2 * k]
+        if sink_side[v] and not sink_side[u]:
+            cut_edges.append((labels[u], labels[v]))
+        elif not network.csr.directed and sink_side[u] and not sink_side[v]:
+            cut_edges.append((labels[v], labels[u]))
+    return (source_labels, sink_labels), cut_edges
+
+
+def max_flow(graph, source, sink, method='dinic'):
+    network, value, _ = _solve(graph, source, sink, method)
+    return value, network.edge_flows()
+
+
+def min_cut(graph, source, sink, method='dinic'):
+    network, value, t = _solve(graph, source, sink, method)
+    partition, cut_edges = _cut(network, t)
+    return value, partition, cut_edges
+
+
+def max_flow_min_cut(graph, source, sink, method='dinic'):
+    network, value, t = _solve(graph, source, sink, method)
+    partition, cut_edges = _cut(network, t)
+    return value, network.edge_flows(), partition, cut_edges
+
+
+def bipartite_matching_flow(graph, left, method='dinic'):
+    csr = as_csr(graph)
+    left_ids = set()
+    for vertex in left:
+        if vertex not in graph:
+            raise ValueError(f"Vertex '{vertex}' not in graph")
+        left_ids.add(csr.vertex_id(vertex))
+    n = csr.num_vertices
+    tails, heads = csr.sources().astype(np.int64), csr.targets.astype(np.int64)
+    is_left = np.zeros(n, dtype=bool)
+    is_left[list(left_ids)] = True
+    keep = is_left[tails] & ~is_left[heads]
+
+    # Unit-capacity network: source n -> left, left -> right, right -> sink n + 1.
+    right_ids = np.unique(heads[keep])
+    left_array = np.array(sorted(left_ids), dtype=np.int64)
+    src = np.concatenate((np.full(len(left_array), n), tails[keep], right_ids))
+    dst = np.concatenate((left_array, heads[keep], np.full(len(right_ids), n + 1)))
+    network = ResidualGraph(CSRGraph.from_arrays(src, dst, np.ones(len(src)), num_vertices=n + 2, directed=True))
+    FLOW_METHODS[method](network, n, n + 1)
+
+    labels = csr.labels
+    matching = {}
+    network_heads, residual = network.heads, network.residual
+    for k in range(network.num_edges):
+        u, v = network_heads[2 * k + 1], network_heads[2 * k]
+        if u < n and v < n and residual[2 * k] == 0:
+            matching[labels[u]] = labels[v]
+    return matching
+
+
+if __name__ == '__main__':
+    from .basics import Graph
+
+    g = Graph(directed=True)
+    for u, v, c in [('s', 'a', 10), ('s', 'c', 10), ('a', 'b', 4), ('a', 'c', 2), ('a', 'd', 8),
+                    ('c', 'd', 9), ('d', 'b', 6), ('b', 't', 10), ('d', 't', 10)]:
+        g.add_edge(u, v, c)
+
+    for method in FLOW_METHODS:
+        value, flows = max_flow(g, 's', 't', method)
+        print(f"Max flow ({method}): {value}")
+    print(f"Edge flows: {max_flow(g, 's', 't')[1]}")
+    print(f"Min cut: {min_cut(g, 's', 't')}")
+
+    jobs = Graph()
+    for worker, task in [('ann', 'x'), ('ann', 'y'), ('bob', 'x'), ('cid', 'y'), ('cid', 'z')]:
+        jobs.add_edge(worker, task)
+    print(f"Matching: {bipartite_matching_flow(jobs, ['ann', 'bob', 'cid'])}")
@@ -0,0 +1,111 @@
+import random
+
+import numpy as np
+
+from .csr import CSRGraph
+
+
+def _edge_weights(rng, count, weighted):
+    if not weighted:
+        return None
+    return rng.integers(1, 101, size=count).astype(np.float64)
+
+
+def erdos_renyi(num_vertices, num_edges, seed=None, directed=False, weighted=True):
+    # G(n, m) by sampling endpoint pairs; self-loops are dropped and repeats collapse.
+    rng = np.random.default_rng(seed)
+    src = rng.integers(0, num_vertices, size=num_edges)
+    dst = rng.integers(0, num_vertices, size=num_edges)
+    keep = src != dst
+    src, dst = src[keep], dst[keep]
+    return CSRGraph.from_arrays(src, dst, _edge_weights(rng, len(src), weighted), num_vertices, directed)
+
+
+def barabasi_albert(num_vertices, edges_per_vertex, seed=None, weighted=True):
+    if not 1 <= edges_per_vertex < num_vertices:
+        raise ValueError("edges_per_vertex must be between 1 and num_vertices - 1")
+    rng = random.Random(seed)
+    m = edges_per_vertex
+    # Every endpoint is appended to `pool`, so a uniform pick from it is a
+    # degree-proportional pick of a vertex.
+    pool = list(range(m))
+    src, dst = [], []
+    for v in range(m, num_vertices):
+        chosen = set()
+        while len(chosen) < m:
+            chosen.add(pool[int(rng.random() * len(pool))])
+        for u in chosen:
+            src.append(v)
+            dst.append(u)
+            pool.append(u)
+        pool.extend([v] * m)
+    weights = _edge_weights(np.random.default_rng(seed), len(src), weighted)
+    return CSRGraph.from_arrays(src, dst, weights, num_vertices, directed=False)
+
+
+def grid(rows, cols, seed=None, weighted=True):
+    ids = np.arange(rows * cols).reshape(rows, cols)
+    src = np.concatenate((ids[:, :-1].ravel(), ids[:-1, :].ravel()))
+    dst = np.concatenate((ids[:, 1:].ravel(), ids[1:, :].ravel()))
+    weights = _edge_weights(np.random.default_rng(seed), len(src), weighted)
+    return CSRGraph.from_arrays(src, dst, weights, rows * cols, directed=False)
+
+
+def random_dag(num_vertices, num_edges, seed=None, weighted=True):
+    # Orient every sampled pair from the lower to the higher position of a
+    # random permutation, so vertex ids carry no hint of the order.
+    rng = np.random.default_rng(seed)
+    rank = rng.permutation(num_vertices)
+    a = rng.integers(0, num_vertices, size=num_edges)
+    b = rng.integers(0, num_vertices, size=num_edges)
+    keep = a != b
+    a, b = a[keep], b[keep]
+    forward = rank[a] < rank[b]
+    src, dst = np.where(forward, a, b), np.where(forward, b, a)
+    return CSRGraph.from_arrays(src, dst, _edge_weights(rng, len(src), weighted), num_vertices, directed=True)
+
+
+def random_geometric(num_vertices, radius, seed=None, weighted=True):
+    rng = np.random.default_rng(seed)
+    points = rng.random((num_vertices, 2))
+    # Bucket points into radius-sized cells; only neighbouring cells can hold
+    # points within range. Half of the 3x3 neighbourhood covers each pair once.
+    cells_per_side = max(1, int(1 / radius))
+    cell = np.minimum((points * cells_per_side).astype(np.int64), cells_per_side - 1)
+    cell_id = cell[:, 0] * cells_per_side + cell[:, 1]
+    order = np.argsort(cell_id, kind='stable')
+    sorted_cells = cell_id[order]
+    starts = np.searchsorted(sorted_cells, np.arange(cells_per_side ** 2))
+    ends = np.searchsorted(sorted_cells, np.arange(cells_per_side ** 2), side='right')
+
+    src_parts, dst_parts = [], []
+    for dx, dy in ((0, 0), (1, -1), (1, 0), (1, 1), (0, 1)):
+        nx, ny = cell[:, 0] + dx, cell[:, 1] + dy
+        valid = (nx >= 0) & (nx < cells_per_side) & (ny >= 0) & (ny < cells_per_side)
+        u = np.flatnonzero(valid)
+        neighbour_cell = nx[u] * cells_per_side + ny[u]
+        counts = ends[neighbour_cell] - starts[neighbour_cell]
+        first = np.repeat(starts[neighbour_cell] - np.cumsum(counts) + counts, counts)
+        v = order[np.arange(int(counts.sum())) + first]
+        u = np.repeat(u, counts)
+        keep = u < v if (dx, dy) == (0, 0) else np.ones(len(u), dtype=bool)
+        close = keep & (np.sum((points[u] - points[v]) ** 2, axis=1) <= radius * radius)
+        src_parts.append(u[close])
+        dst_parts.append(v[close])
+
+    src, dst = np.concatenate(src_parts), np.concatenate(dst_parts)
+    if weighted:
+        # Euclidean length scaled to integers keeps weights comparable with the other generators.
+        weights = np.maximum(1, np.rint(100 * np.sqrt(np.sum((points[src] - points[dst]) ** 2, axis=1)) / radius))
+    else:
+        weights = None
+    return CSRGraph.from_arrays(src, dst, weights, num_vertices, directed=False)
+
+
+if __name__ == '__main__':
+    for name, graph in [('Erdos-Renyi', erdos_renyi(1000, 4000, seed=1)),
+                        ('Barabasi-Albert', barabasi_albert(1000, 4, seed=1)),
+                        ('Grid', grid(30, 30, seed=1)),
+                        ('Random DAG', random_dag(1000, 4000, seed=1)),
+                        ('Random geometric', random_geometric(1000, 0.05, seed=1))]:
+        print(f"{name}: {graph.num_vertices} vertices, {graph.num_edges} edges")
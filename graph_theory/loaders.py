@@ -0,0 +1,159 @@
+import itertools
+import json
+import struct
+
+import numpy as np
+
+from .csr import CSRGraph, _id_dtype
+
+_CSR_MAGIC = b'CSRG'
+_CSR_VERSION = 1
+_CSR_HEADER = struct.Struct('<4sHHqqq')
+_FLAG_DIRECTED = 1
+_FLAG_WEIGHTED = 2
+
+
+def _target_dtype(num_vertices):
+    return np.dtype(_id_dtype(num_vertices)).newbyteorder('<')
+
+
+def _open_text(source):
+    if hasattr(source, 'read'):
+        return source, False
+    return open(source, 'r', encoding='utf-8'), True
+
+
+def load_edge_list(source, directed=False, delimiter=None, comments='#', relabel=False,
+                   num_vertices=None, chunk_size=1_000_000):
+    stream, owned = _open_text(source)
+    dtype = str if relabel else np.float64
+    src_parts, dst_parts, weight_parts = [], [], []
+    weighted = False
+    try:
+        while True:
+            lines = list(itertools.islice(stream, chunk_size))
+            if not lines:
+                break
+            block = np.loadtxt(lines, dtype=dtype, delimiter=delimiter, comments=comments, ndmin=2)
+            if not block.size:
+                continue
+            if block.shape[1] not in (2, 3):
+                raise ValueError("Edge list rows must be 'u v' or 'u v weight'")
+            src_parts.append(block[:, 0])
+            dst_parts.append(block[:, 1])
+            if block.shape[1] == 3:
+                weighted = True
+                weight_parts.append(block[:, 2].astype(np.float64))
+            else:
+                weight_parts.append(np.full(len(block), np.nan))
+    finally:
+        if owned:
+            stream.close()
+
+    src = np.concatenate(src_parts) if src_parts else np.empty(0, dtype=dtype)
+    dst = np.concatenate(dst_parts) if dst_parts else np.empty(0, dtype=dtype)
+    weights = np.concatenate(weight_parts) if weighted else None
+    labels = None
+    if relabel:
+        labels, ids = np.unique(np.concatenate((src, dst)), return_inverse=True)
+        src, dst = ids[:len(src)], ids[len(src):]
+        labels = labels.tolist()
+        num_vertices = len(labels)
+    elif len(src) and not (np.all(src == np.floor(src)) and np.all(dst == np.floor(dst))):
+        raise ValueError("Vertex ids must be integers; pass relabel=True for named vertices")
+    return CSRGraph.from_arrays(src.astype(np.int64), dst.astype(np.int64), weights,
+                                num_vertices=num_vertices, directed=directed, labels=labels)
+
+
+def load_edge_array(path, directed=False, num_vertices=None, mmap=False):
+    data = np.load(path, mmap_mode='r' if mmap else None)
+    if isinstance(data, np.lib.npyio.NpzFile):
+        with data:
+            if 'edges' in data:
+                edges = data['edges']
+                src, dst = edges[:, 0], edges[:, 1]
+                weights = edges[:, 2] if edges.shape[1] > 2 else None
+            else:
+                src, dst = data['src'], data['dst']
+                weights = data['weights'] if 'weights' in data else None
+    else:
+        if data.ndim != 2 or data.shape[1] not in (2, 3):
+            raise ValueError("Edge array must have shape (m, 2) or (m, 3)")
+        src, dst = data[:, 0], data[:, 1]
+        weights = data[:, 2] if data.shape[1] > 2 else None
+    return CSRGraph.from_arrays(src, dst, weights, num_vertices=num_vertices, directed=directed)
+
+
+def save_csr(csr, path):
+    if csr.weights.dtype == object:
+        raise TypeError("Only numeric edge weights can be stored in a binary CSR file")
+    weighted = bool(np.any(~np.isnan(csr.weights)))
+    flags = (_FLAG_DIRECTED if csr.directed else 0) | (_FLAG_WEIGHTED if weighted else 0)
+    labels = b'' if csr._index is None else json.dumps(list(csr.labels)).encode('utf-8')
+    with open(path, 'wb') as f:
+        f.write(_CSR_HEADER.pack(_CSR_MAGIC, _CSR_VERSION, flags, csr.num_vertices, len(csr.targets), len(labels)))
+        f.write(csr.offsets.astype('<i8').tobytes())
+        f.write(csr.targets.astype(_target_dtype(csr.num_vertices)).tobytes())
+        if weighted:
+            f.write(csr.weights.astype('<f8').tobytes())
+        f.write(labels)
+
+
+def _hashable(label):
+    return tuple(_hashable(x) for x in label) if isinstance(label, list) else label
+
+
+def load_csr(path, mmap=True):
+    with open(path, 'rb') as f:
+        magic, version, flags, num_vertices, num_entries, label_bytes = _CSR_HEADER.unpack(f.read(_CSR_HEADER.size))
+        if magic != _CSR_MAGIC or version != _CSR_VERSION:
+            raise ValueError(f"'{path}' is not a CSR graph file")
+        layout = [('offsets', np.dtype('<i8'), num_vertices + 1),
+                  ('targets', _target_dtype(num_vertices), num_entries)]
+        if flags & _FLAG_WEIGHTED:
+            layout.append(('weights', np.dtype('<f8'), num_entries))
+
+        arrays = {}
+        position = _CSR_HEADER.size
+        for name, dtype, count in layout:
+            if mmap:
+                arrays[name] = np.memmap(path, dtype=dtype, mode='r', offset=position, shape=(count,))
+            else:
+                f.seek(position)
+                arrays[name] = np.fromfile(f, dtype=dtype, count=count)
+            position += dtype.itemsize * count
+        labels = None
+        if label_bytes:
+            f.seek(position)
+            labels = [_hashable(label) for label in json.loads(f.read(label_bytes).decode('utf-8'))]
+
+    return CSRGraph(arrays['offsets'], arrays['targets'], arrays.get('weights'), labels,
+                    directed=bool(flags & _FLAG_DIRECTED))
+
+
+def csr_from_payload(graph_data):
+    edges = graph_data.get('edges', [])
+    return CSRGraph.from_edges(
+        [(edge['u'], edge['v'], edge.get('weight')) for edge in edges],
+        directed=graph_data.get('directed', False),
+        vertices=graph_data.get('vertices', []))
+
+
+if __name__ == '__main__':
+    import io
+    import os
+    import tempfile
+
+    text = io.StringIO("# u v weight\n0 1 4\n0 2 1\n2 1 2\n1 3 5\n")
+    csr = load_edge_list(text, directed=True)
+    print(csr)
+    print(f"Edges: {csr.get_edges()}")
+
+    named = load_edge_list(io.StringIO("a b\nb c\n"), relabel=True)
+    print(f"Named vertices: {named.get_vertices()}, edges: {named.get_edges()}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'graph.csr')
+        save_csr(csr, path)
+        mapped = load_csr(path)
+        print(f"Memory-mapped reload: {mapped.get_edges()}")
@@ -0,0 +1,245 @@
+import numpy as np
+
+from .algorithms import _numeric_weights, _undirected_adjacency
+from .csr import as_csr
+
+
+def _odd_cycle(parent, depth, u, v):
+    left, right = [u], [v]
+    while left[-1] != right[-1]:
+        if depth[left[-1]] >= depth[right[-1]]:
+            left.append(parent[left[-1]])
+        else:
+            right.append(parent[right[-1]])
+    right.pop()
+    return left + right[::-1]
+
+
+def _two_colouring(csr):
+    offsets, targets = _undirected_adjacency(csr)
+    n = csr.num_vertices
+    depth = [-1] * n
+    parent = [-1] * n
+
+    for root in range(n):
+        if depth[root] >= 0:
+            continue
+        depth[root] = 0
+        queue = [root]
+        for u in queue:
+            next_depth = depth[u] + 1
+            for k in range(offsets[u], offsets[u + 1]):
+                v = targets[k]
+                if depth[v] < 0:
+                    depth[v] = next_depth
+                    parent[v] = u
+                    queue.append(v)
+                elif (depth[v] ^ depth[u]) & 1 == 0:
+                    # Same colour at both ends: the two tree paths up to their
+                    # common ancestor close an odd cycle.
+                    return None, _odd_cycle(parent, depth, u, v)
+    return [d & 1 for d in depth], None
+
+
+def check_bipartite(graph):
+    csr = as_csr(graph)
+    colours, cycle = _two_colouring(csr)
+    labels = csr.labels
+    if cycle is not None:
+        return False, [labels[v] for v in cycle]
+    return True, {labels[v]: colour for v, colour in enumerate(colours)}
+
+
+def is_bipartite(graph):
+    return check_bipartite(graph)[0]
+
+
+def _left_ids(graph, csr, left):
+    if left is None:
+        colours, cycle = _two_colouring(csr)
+        if cycle is not None:
+            raise ValueError("Graph is not bipartite.")
+        return [v for v in range(csr.num_vertices) if colours[v] == 0]
+    ids = []
+    for vertex in left:
+        if vertex not in graph:
+            raise ValueError(f"Vertex '{vertex}' not in graph")
+        ids.append(csr.vertex_id(vertex))
+    return ids
+
+
+def _hopcroft_karp(offsets, targets, left, n):
+    is_left = bytearray(n)
+    for u in left:
+        is_left[u] = 1
+    match = [-1] * n
+
+    while True:
+        # BFS layers alternate free edges out of the left side and matched edges
+        # back into it; stop at the first layer that reaches a free right vertex.
+        dist = [-1] * n
+        queue = [u for u in left if match[u] < 0]
+        for u in queue:
+            dist[u] = 0
+        limit = None
+        for u in queue:
+            if limit is not None and dist[u] > limit:
+                break
+            for k in range(offsets[u], offsets[u + 1]):
+                v = targets[k]
+                if is_left[v]:
+                    continue
+                w = match[v]
+                if w < 0:
+                    if limit is None:
+                        limit = dist[u]
+                elif dist[w] < 0:
+                    dist[w] = dist[u] + 1
+                    queue.append(w)
+        if limit is None:
+            return match
+
+        # Vertex-disjoint shortest augmenting paths by iterative DFS with arc pointers.
+        pointer = offsets[:-1]
+        for root in [u for u in left if match[u] < 0]:
+            stack, via = [root], []
+            while stack:
+                u = stack[-1]
+                end = offsets[u + 1]
+                while pointer[u] < end:
+                    v = targets[pointer[u]]
+                    pointer[u] += 1
+                    if is_left[v]:
+                        continue
+                    w = match[v]
+                    if w < 0 and dist[u] == limit:
+                        via.append(v)
+                        for x, y in zip(stack, via):
+                            match[x] = y
+                            match[y] = x
+                        stack = []
+                        break
+                    if w >= 0 and dist[w] == dist[u] + 1:
+                        stack.append(w)
+                        via.append(v)
+                        break
+                else:
+                    dist[u] = -1
+                    stack.pop()
+                    if via:
+                        via.pop()
+
+
+def hopcroft_karp(graph, left=None):
+    csr = as_csr(graph)
+    left_ids = _left_ids(graph, csr, left)
+    offsets, targets = _undirected_adjacency(csr)
+    match = _hopcroft_karp(offsets, targets, left_ids, csr.num_vertices)
+    labels = csr.labels
+    return {labels[u]: labels[match[u]] for u in left_ids if match[u] >= 0}
+
+
+def linear_assignment(cost, maximize=False):
+    cost = np.asarray(cost, dtype=np.float64)
+    if cost.ndim != 2:
+        raise ValueError("Cost matrix must be two-dimensional")
+    transposed = cost.shape[0] > cost.shape[1]
+    work = cost.T if transposed else cost
+    if maximize:
+        work = -work
+    n, m = work.shape
+
+    # Shortest augmenting path Hungarian method with potentials u (rows) and
+    # v (columns); column 0 is a sentinel and p[j] is the 1-based row on column j.
+    u = np.zeros(n + 1)
+    v = np.zeros(m + 1)
+    p = np.zeros(m + 1, dtype=np.int64)
+    way = np.zeros(m + 1, dtype=np.int64)
+    for i in range(1, n + 1):
+        p[0] = i
+        j0 = 0
+        minv = np.full(m + 1, np.inf)
+        used = np.zeros(m + 1, dtype=bool)
+        while True:
+            used[j0] = True
+            i0 = p[j0]
+            free = ~used
+            reduced = work[i0 - 1] - u[i0] - v[1:]
+            improve = free[1:] & (reduced < minv[1:])
+            minv[1:][improve] = reduced[improve]
+            way[1:][improve] = j0
+            candidates = np.where(free, minv, np.inf)
+            candidates[0] = np.inf
+            j1 = int(np.argmin(candidates))
+            delta = candidates[j1]
+            if not np.isfinite(delta):
+                raise ValueError("Cost matrix has no finite assignment.")
+            u[p[used]] += delta
+            v[used] -= delta
+            minv[free] -= delta
+            j0 = j1
+            if p[j0] == 0:
+                break
+        while j0:
+            j1 = way[j0]
+            p[j0] = p[j1]
+            j0 = j1
+
+    columns = np.flatnonzero(p[1:])
+    rows = p[1:][columns] - 1
+    if transposed:
+        rows, columns = columns, rows
+    order = np.argsort(rows)
+    rows, columns = rows[order], columns[order]
+    return rows, columns, cost[rows, columns].sum()
+
+
+def min_cost_assignment(graph, left=None, maximize=False):
+    csr = as_csr(graph)
+    left_ids = _left_ids(graph, csr, left)
+    is_left = np.zeros(csr.num_vertices, dtype=bool)
+    is_left[left_ids] = True
+    sources, targets = csr.sources(), csr.targets
+    weights = _numeric_weights(csr)
+    forward = is_left[sources] & ~is_left[targets]
+    backward = ~is_left[sources] & is_left[targets]
+    rows = np.concatenate((sources[forward], targets[backward]))
+    cols = np.concatenate((targets[forward], sources[backward]))
+    values = np.concatenate((weights[forward], weights[backward]))
+
+    right_ids = np.unique(cols)
+    row_index = np.full(csr.num_vertices, -1, dtype=np.int64)
+    row_index[left_ids] = np.arange(len(left_ids))
+    col_index = np.full(csr.num_vertices, -1, dtype=np.int64)
+    col_index[right_ids] = np.arange(len(right_ids))
+
+    # Missing edges cost infinity (or minus infinity when maximising).
+    cost = np.full((len(left_ids), len(right_ids)), -np.inf if maximize else np.inf)
+    cost[row_index[rows], col_index[cols]] = values
+    assigned_rows, assigned_cols, total = linear_assignment(cost, maximize)
+
+    labels = csr.labels
+    left_array = np.asarray(left_ids, dtype=np.int64)
+    matching = {labels[int(left_array[r])]: labels[int(right_ids[c])]
+                for r, c in zip(assigned_rows.tolist(), assigned_cols.tolist())}
+    return matching, int(total) if float(total).is_integer() else float(total)
+
+
+if __name__ == '__main__':
+    from .basics import Graph
+
+    square = Graph()
+    for u, v in [(1, 2), (2, 3), (3, 4), (4, 1)]:
+        square.add_edge(u, v)
+    print(f"Square bipartite? {check_bipartite(square)}")
+    square.add_edge(1, 3)
+    print(f"Square with diagonal: {check_bipartite(square)}")
+
+    jobs = Graph()
+    for worker, task, cost in [('ann', 'x', 4), ('ann', 'y', 1), ('bob', 'x', 2), ('bob', 'z', 5),
+                               ('cid', 'y', 3), ('cid', 'z', 2)]:
+        jobs.add_edge(worker, task, cost)
+    print(f"Hopcroft-Karp: {hopcroft_karp(jobs, ['ann', 'bob', 'cid'])}")
+    print(f"Min-cost assignment: {min_cost_assignment(jobs, ['ann', 'bob', 'cid'])}")
+    print(f"Max-weight assignment: {min_cost_assignment(jobs, ['ann', 'bob', 'cid'], maximize=True)}")
+    print(f"Linear assignment: {linear_assignment([[4, 1, 3], [2, 0, 5], [3, 2, 2]])}")
@@ -0,0 +1,247 @@
+import heapq
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from .algorithms import (DSU, _adjacency, _kruskal_positions, _numeric_weights, _spanning_edges,
+                         _undirected_edge_positions, connected_component_labels)
+from .csr import as_csr
+
+_worker_edges = None
+
+
+class IndexedMinHeap:
+    def __init__(self, capacity):
+        self.heap = []
+        self.keys = [None] * capacity
+        self.position = [-1] * capacity
+
+    def __len__(self):
+        return len(self.heap)
+
+    def __contains__(self, item):
+        return self.position[item] >= 0
+
+    def push_or_decrease(self, item, key):
+        if self.position[item] < 0:
+            self.heap.append(item)
+            self.position[item] = len(self.heap) - 1
+        elif key >= self.keys[item]:
+            return False
+        self.keys[item] = key
+        self._sift_up(self.position[item])
+        return True
+
+    def pop(self):
+        heap, position = self.heap, self.position
+        top = heap[0]
+        last = heap.pop()
+        position[top] = -1
+        if heap:
+            heap[0] = last
+            position[last] = 0
+            self._sift_down(0)
+        return top, self.keys[top]
+
+    def _sift_up(self, i):
+        heap, keys, position = self.heap, self.keys, self.position
+        item = heap[i]
+        while i > 0:
+            parent = (i - 1) >> 1
+            if keys[heap[parent]] <= keys[item]:
+                break
+            heap[i] = heap[parent]
+            position[heap[i]] = i
+            i = parent
+        heap[i] = item
+        position[item] = i
+
+    def _sift_down(self, i):
+        heap, keys, position = self.heap, self.keys, self.position
+        item = heap[i]
+        size = len(heap)
+        while True:
+            child = 2 * i + 1
+            if child >= size:
+                break
+            if child + 1 < size and keys[heap[child + 1]] < keys[heap[child]]:
+                child += 1
+            if keys[item] <= keys[heap[child]]:
+                break
+            heap[i] = heap[child]
+            position[heap[i]] = i
+            i = child
+        heap[i] = item
+        position[item] = i
+
+
+def _check_undirected(graph):
+    if graph.directed:
+        raise TypeError("Minimum spanning trees apply to undirected graphs")
+
+
+def _prim_positions(csr, weights, start, lazy):
+    offsets, targets = _adjacency(csr)
+    in_tree = bytearray(csr.num_vertices)
+    chosen = []
+
+    if lazy:
+        in_tree[start] = 1
+        frontier = [(weights[k], k, targets[k]) for k in range(offsets[start], offsets[start + 1])]
+        heapq.heapify(frontier)
+        while frontier:
+            _, position, vertex = heapq.heappop(frontier)
+            if in_tree[vertex]:
+                continue
+            in_tree[vertex] = 1
+            chosen.append(position)
+            for k in range(offsets[vertex], offsets[vertex + 1]):
+                if not in_tree[targets[k]]:
+                    heapq.heappush(frontier, (weights[k], k, targets[k]))
+        return chosen
+
+    best_edge = [-1] * csr.num_vertices
+    frontier = IndexedMinHeap(csr.num_vertices)
+    frontier.push_or_decrease(start, 0)
+    while frontier:
+        vertex, _ = frontier.pop()
+        in_tree[vertex] = 1
+        if best_edge[vertex] >= 0:
+            chosen.append(best_edge[vertex])
+        for k in range(offsets[vertex], offsets[vertex + 1]):
+            neighbor = targets[k]
+            if not in_tree[neighbor] and frontier.push_or_decrease(neighbor, weights[k]):
+                best_edge[neighbor] = k
+    return chosen
+
+
+def prim_mst(graph, start_node=None, lazy=False):
+    _check_undirected(graph)
+    csr = as_csr(graph)
+    if not csr.num_vertices:
+        return [], 0
+    if start_node is not None and start_node not in graph:
+        raise ValueError(f"Start node '{start_node}' not found in graph.")
+    start = 0 if start_node is None else csr.vertex_id(start_node)
+    weights = _numeric_weights(csr).tolist()
+    return _spanning_edges(csr, _prim_positions(csr, weights, start, lazy), weights)
+
+
+def _cheapest_edges(u, v, w, edge_ids, components):
+    cu, cv = components[u], components[v]
+    crossing = np.flatnonzero(cu != cv)
+    owners = np.concatenate((cu[crossing], cv[crossing]))
+    candidates = np.concatenate((edge_ids[crossing], edge_ids[crossing]))
+    weights = np.concatenate((w[crossing], w[crossing]))
+    return _first_per_owner(owners, weights, candidates)
+
+
+def _first_per_owner(owners, weights, candidates):
+    # Ties on weight are broken by edge id so every component agrees on one total order.
+    order = np.lexsort((candidates, weights, owners))
+    owners, weights, candidates = owners[order], weights[order], candidates[order]
+    first = np.ones(len(owners), dtype=bool)
+    first[1:] = owners[1:] != owners[:-1]
+    return owners[first], weights[first], candidates[first]
+
+
+def _init_worker(u, v, w, edge_ids):
+    global _worker_edges
+    _worker_edges = (u, v, w, edge_ids)
+
+
+def _worker_cheapest(start, stop, components):
+    u, v, w, edge_ids = _worker_edges
+    return _cheapest_edges(u[start:stop], v[start:stop], w[start:stop], edge_ids[start:stop], components)
+
+
+def _boruvka_positions(csr, weights, processes, chunk_size):
+    positions = _undirected_edge_positions(csr)
+    u = csr.sources()[positions].astype(np.int64)
+    v = csr.targets[positions].astype(np.int64)
+    w = np.asarray(weights, dtype=np.float64)[positions]
+    edge_ids = np.arange(len(positions))
+    components = np.arange(csr.num_vertices)
+    num_components = csr.num_vertices
+    chosen = []
+
+    pool = None
+    if processes > 1 and len(positions) > chunk_size:
+        pool = ProcessPoolExecutor(max_workers=processes, initializer=_init_worker, initargs=(u, v, w, edge_ids))
+    try:
+        while num_components > 1:
+            if pool is None:
+                owners, best_weights, best = _cheapest_edges(u, v, w, edge_ids, components)
+            else:
+                futures = [pool.submit(_worker_cheapest, start, start + chunk_size, components)
+                           for start in range(0, len(positions), chunk_size)]
+                parts = [future.result() for future in futures]
+                owners, best_weights, best = _first_per_owner(*(np.concatenate(column) for column in zip(*parts)))
+            if not len(best):
+                break
+
+            dsu = DSU(num_components)
+            for edge in np.unique(best).tolist():
+                if dsu.union(int(components[u[edge]]), int(components[v[edge]])):
+                    chosen.append(int(positions[edge]))
+            roots = np.array([dsu.find(c) for c in range(num_components)])
+            _, components = np.unique(roots[components], return_inverse=True)
+            num_components = dsu.count
+    finally:
+        if pool is not None:
+            pool.shutdown()
+    return chosen
+
+
+def boruvka_mst(graph, processes=1, chunk_size=1 << 18):
+    _check_undirected(graph)
+    csr = as_csr(graph)
+    weights = _numeric_weights(csr)
+    if processes is None:
+        processes = os.cpu_count()
+    chosen = _boruvka_positions(csr, weights, processes, chunk_size)
+    return _spanning_edges(csr, chosen, weights.tolist())
+
+
+def minimum_spanning_forest(graph, method='kruskal'):
+    _check_undirected(graph)
+    csr = as_csr(graph)
+    weights = _numeric_weights(csr)
+    weight_list = weights.tolist()
+    count, labels = connected_component_labels(csr)
+    if method == 'kruskal':
+        chosen = _kruskal_positions(csr, weights)
+    elif method == 'boruvka':
+        chosen = _boruvka_positions(csr, weights, 1, 1 << 18)
+    elif method == 'prim':
+        roots = np.unique(labels, return_index=True)[1]
+        chosen = [p for root in roots.tolist() for p in _prim_positions(csr, weight_list, root, False)]
+    else:
+        raise ValueError(f"Unknown spanning tree method '{method}'")
+
+    sources = csr.sources()
+    per_component = [[] for _ in range(count)]
+    for position in chosen:
+        per_component[labels[sources[position]]].append(position)
+    return [_spanning_edges(csr, positions, weight_list) for positions in per_component]
+
+
+if __name__ == '__main__':
+    from .basics import Graph
+
+    g = Graph()
+    g.add_edge('A', 'B', 4)
+    g.add_edge('A', 'C', 2)
+    g.add_edge('B', 'C', 5)
+    g.add_edge('B', 'D', 10)
+    g.add_edge('C', 'E', 3)
+    g.add_edge('E', 'D', 4)
+    g.add_edge('D', 'F')
+    g.add_edge('G', 'H', 1)
+
+    print(f"Prim (indexed heap) from A: {prim_mst(g, 'A')}")
+    print(f"Prim (lazy heap) from A: {prim_mst(g, 'A', lazy=True)}")
+    print(f"Boruvka: {boruvka_mst(g)}")
+    for i, (edges, weight) in enumerate(minimum_spanning_forest(g)):
+        print(f"Component {i}: {edges} (weight {weight})")
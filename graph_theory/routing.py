@@ -0,0 +1,156 @@
+import heapq
+
+import numpy as np
+
+from .algorithms import NEGATIVE_WEIGHTS, _adjacency, _dijkstra_weights, _negative_tails, dijkstra, reconstruct_path
+from .csr import as_csr
+
+
+def _a_star_ids(csr, source, target, estimate):
+    offsets, targets = _adjacency(csr)
+    weights = csr.derived('dijkstra_weights', _dijkstra_weights)
+    negative = csr.derived('negative_tails', _negative_tails)
+
+    distances = {source: 0}
+    predecessors = {source: None}
+    priority_queue = [(estimate(source), 0, source)]
+
+    while priority_queue:
+        _, current_distance, current_node = heapq.heappop(priority_queue)
+        if current_distance > distances[current_node]:
+            continue
+        if current_node == target:
+            return current_distance, reconstruct_path(predecessors, target)
+        if current_node in negative:
+            raise ValueError(NEGATIVE_WEIGHTS)
+
+        for position in range(offsets[current_node], offsets[current_node + 1]):
+            neighbor = targets[position]
+            distance = current_distance + weights[position]
+            if distance < distances.get(neighbor, float('inf')):
+                distances[neighbor] = distance
+                predecessors[neighbor] = current_node
+                heapq.heappush(priority_queue, (distance + estimate(neighbor), distance, neighbor))
+
+    return float('inf'), []
+
+
+def _endpoints(graph, csr, source, target):
+    for node in (source, target):
+        if node not in graph:
+            raise ValueError(f"Node '{node}' not found in graph.")
+    return csr.vertex_id(source), csr.vertex_id(target)
+
+
+def a_star(graph, source, target, heuristic=None):
+    csr = as_csr(graph)
+    s, t = _endpoints(graph, csr, source, target)
+    labels = csr.labels
+    if heuristic is None:
+        estimate = lambda v: 0
+    else:
+        estimate = lambda v: heuristic(labels[v], target)
+    distance, path = _a_star_ids(csr, s, t, estimate)
+    return distance, [labels[v] for v in path]
+
+
+def _distance_row(csr, landmark):
+    distances, _ = dijkstra(csr, csr.labels[landmark])
+    row = np.full(csr.num_vertices, np.inf)
+    row[[csr.vertex_id(v) for v in distances]] = list(distances.values())
+    return row
+
+
+class LandmarkTable:
+    def __init__(self, landmarks, from_landmarks, to_landmarks):
+        self.landmarks = np.asarray(landmarks, dtype=np.int64)
+        self.from_landmarks = np.asarray(from_landmarks, dtype=np.float64)
+        self.to_landmarks = np.asarray(to_landmarks, dtype=np.float64)
+        if self.from_landmarks.shape != self.to_landmarks.shape or len(self.landmarks) != len(self.from_landmarks):
+            raise ValueError("Landmark tables must have one row per landmark")
+
+    @property
+    def num_vertices(self):
+        return self.from_landmarks.shape[1]
+
+    @classmethod
+    def build(cls, graph, landmarks=None, count=4):
+        csr = as_csr(graph)
+        reverse = csr.reverse()
+        if landmarks is not None:
+            chosen = [csr.vertex_id(v) for v in landmarks]
+        else:
+            chosen = [0] if csr.num_vertices else []
+        rows_from = [_distance_row(csr, v) for v in chosen]
+
+        # Farthest-point selection: the next landmark is the reachable vertex
+        # furthest from every landmark picked so far.
+        while landmarks is None and 0 < len(chosen) < min(count, csr.num_vertices):
+            nearest = np.min(rows_from, axis=0)
+            nearest[~np.isfinite(nearest)] = -1
+            nearest[chosen] = -1
+            candidate = int(np.argmax(nearest))
+            if nearest[candidate] <= 0:
+                break
+            chosen.append(candidate)
+            rows_from.append(_distance_row(csr, candidate))
+
+        rows_to = rows_from if reverse is csr else [_distance_row(reverse, v) for v in chosen]
+        shape = (len(chosen), csr.num_vertices)
+        return cls(chosen, np.reshape(rows_from, shape), np.reshape(rows_to, shape))
+
+    def save(self, path):
+        np.savez(path, landmarks=self.landmarks, from_landmarks=self.from_landmarks, to_landmarks=self.to_landmarks)
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path) as data:
+            return cls(data['landmarks'], data['from_landmarks'], data['to_landmarks'])
+
+    def estimator(self, target):
+        # Triangle inequality: d(v, t) >= d(L, t) - d(L, v) and d(v, t) >= d(v, L) - d(t, L).
+        from_target = self.from_landmarks[:, target].tolist()
+        to_target = self.to_landmarks[:, target].tolist()
+        rows = list(zip(self.from_landmarks.tolist(), self.to_landmarks.tolist(), from_target, to_target))
+        inf = float('inf')
+
+        def estimate(v):
+            best = 0
+            for from_row, to_row, landmark_to_target, target_to_landmark in rows:
+                landmark_to_v, v_to_landmark = from_row[v], to_row[v]
+                if landmark_to_v != inf and landmark_to_target != inf and landmark_to_target - landmark_to_v > best:
+                    best = landmark_to_target - landmark_to_v
+                if v_to_landmark != inf and target_to_landmark != inf and v_to_landmark - target_to_landmark > best:
+                    best = v_to_landmark - target_to_landmark
+            return best
+
+        return estimate
+
+
+def alt_search(graph, source, target, table):
+    csr = as_csr(graph)
+    if table.num_vertices != csr.num_vertices:
+        raise ValueError("Landmark table was built for a different graph")
+    s, t = _endpoints(graph, csr, source, target)
+    distance, path = _a_star_ids(csr, s, t, table.estimator(t))
+    labels = csr.labels
+    return distance, [labels[v] for v in path]
+
+
+if __name__ == '__main__':
+    from .basics import Graph
+
+    g = Graph()
+    for x in range(5):
+        for y in range(5):
+            if x < 4:
+                g.add_edge((x, y), (x + 1, y), 1)
+            if y < 4:
+                g.add_edge((x, y), (x, y + 1), 1)
+
+    manhattan = lambda u, v: abs(u[0] - v[0]) + abs(u[1] - v[1])
+    print(f"A* (0,0)->(4,4): {a_star(g, (0, 0), (4, 4), manhattan)}")
+
+    table = LandmarkTable.build(g, count=3)
+    print(f"Landmarks: {[as_csr(g).labels[v] for v in table.landmarks]}")
+    print(f"ALT (0,0)->(4,4): {alt_search(g, (0, 0), (4, 4), table)}")
@@ -0,0 +1,105 @@
+import hashlib
+import json
+import sys
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+from .csr import CSRGraph
+
+
+class UnknownGraphHandle(KeyError):
+    pass
+
+
+def payload_hash(kind, payload):
+    canonical = json.dumps(payload, sort_keys=True, separators=(',', ':'), default=str)
+    return hashlib.sha256(f"{kind}:{canonical}".encode('utf-8')).hexdigest()
+
+
+def estimate_size(value):
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    if isinstance(value, CSRGraph):
+        size = value.offsets.nbytes + value.targets.nbytes + value.weights.nbytes
+        if value._index is not None:
+            size += 100 * value.num_vertices
+        return size + sum(estimate_size(derived) for derived in value._derived.values())
+    if hasattr(value, 'data') and hasattr(value, 'indices') and hasattr(value, 'indptr'):
+        return value.data.nbytes + value.indices.nbytes + value.indptr.nbytes
+    if isinstance(value, (list, tuple)):
+        if value and isinstance(value[0], (list, tuple, np.ndarray)):
+            return sys.getsizeof(value) + sum(estimate_size(item) for item in value)
+        # Flat lists hold a pointer plus (usually) a boxed number per element.
+        return sys.getsizeof(value) + 32 * len(value)
+    return sys.getsizeof(value)
+
+
+class GraphStore:
+    def __init__(self, max_bytes=512 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __contains__(self, handle):
+        with self._lock:
+            return handle in self._entries
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
+
+    def put(self, kind, payload, parse):
+        handle = payload_hash(kind, payload)
+        with self._lock:
+            if handle in self._entries:
+                self._entries.move_to_end(handle)
+                return handle
+        value = parse(payload)
+        with self._lock:
+            self._entries[handle] = [kind, value, estimate_size(value)]
+            self._evict()
+        return handle
+
+    def get(self, handle, kind=None):
+        with self._lock:
+            if handle not in self._entries:
+                raise UnknownGraphHandle(f"Unknown graph handle '{handle}'")
+            entry = self._entries[handle]
+            if kind is not None and entry[0] != kind:
+                raise UnknownGraphHandle(f"Graph handle '{handle}' does not refer to a {kind}")
+            self._entries.move_to_end(handle)
+            # Derived indexes are built lazily, so re-measure on every access.
+            entry[2] = estimate_size(entry[1])
+            self._evict(keep=handle)
+            return entry[1]
+
+    def discard(self, handle):
+        with self._lock:
+            self._entries.pop(handle, None)
+
+    def memory_usage(self):
+        with self._lock:
+            return sum(entry[2] for entry in self._entries.values())
+
+    def _evict(self, keep=None):
+        total = sum(entry[2] for entry in self._entries.values())
+        for handle in list(self._entries):
+            if total <= self.max_bytes:
+                break
+            if handle == keep or len(self._entries) == 1:
+                continue
+            total -= self._entries.pop(handle)[2]
+
+
+if __name__ == '__main__':
+    from .loaders import csr_from_payload
+
+    store = GraphStore(max_bytes=4096)
+    payload = {'vertices': ['A', 'B', 'C'], 'edges': [{'u': 'A', 'v': 'B', 'weight': 1}, {'u': 'B', 'v': 'C'}]}
+    handle = store.put('graph', payload, csr_from_payload)
+    print(f"Handle: {handle}")
+    print(f"Same payload, same handle: {store.put('graph', dict(payload), csr_from_payload) == handle}")
+    print(f"Stored graph edges: {store.get(handle, 'graph').get_edges()}")
+    print(f"Cache size: {store.memory_usage()} bytes")
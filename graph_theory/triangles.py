@@ -0,0 +1,167 @@
+import numpy as np
+
+from .csr import CSRGraph, as_csr
+from .views import induced_subgraph
+
+# Upper bound on wedges materialised at once while counting triangles.
+_WEDGE_BLOCK = 1 << 22
+
+
+def _simple_undirected(csr):
+    # Triangles, clustering and cores ignore direction, weights and self-loops.
+    def build(c):
+        sources, targets = c.sources(), c.targets
+        keep = sources != targets
+        if not c.directed and keep.all():
+            return c
+        return CSRGraph.from_arrays(sources[keep], targets[keep], num_vertices=c.num_vertices, directed=False)
+    return csr.derived('simple_undirected', build)
+
+
+def _forward_arcs(simple):
+    # Orient each edge from lower to higher (degree, id) rank. Every vertex then
+    # has O(sqrt(m)) out-neighbours, which bounds the wedges to O(m^1.5).
+    n = simple.num_vertices
+    degree = simple.out_degrees()
+    rank = np.empty(n, dtype=np.int64)
+    rank[np.lexsort((np.arange(n), degree))] = np.arange(n)
+    sources, targets = simple.sources().astype(np.int64), simple.targets.astype(np.int64)
+    forward = rank[sources] < rank[targets]
+    sources, targets = sources[forward], targets[forward]
+    order = np.lexsort((rank[targets], sources))
+    sources, targets = sources[order], targets[order]
+    offsets = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(np.bincount(sources, minlength=n), out=offsets[1:])
+    return offsets, sources, targets
+
+
+def _triangle_counts(csr):
+    simple = _simple_undirected(csr)
+    n = simple.num_vertices
+    offsets, sources, targets = _forward_arcs(simple)
+    counts = np.zeros(n, dtype=np.int64)
+    if not len(targets):
+        return counts
+    # Every forward arc as a sorted key, so wedge closure is one searchsorted.
+    sorted_keys = np.sort(sources * n + targets)
+
+    # Arc i pairs with every later arc j of the same source; each pair (v, w) is a
+    # wedge at u that closes into a triangle when v -> w is also a forward arc.
+    later = offsets[sources + 1] - np.arange(len(targets)) - 1
+    block_start = 0
+    cumulative = np.cumsum(later)
+    while block_start < len(targets):
+        limit = (cumulative[block_start - 1] if block_start else 0) + _WEDGE_BLOCK
+        block_end = max(block_start + 1, int(np.searchsorted(cumulative, limit, side='right')))
+        arcs = np.arange(block_start, block_end)
+        per_arc = later[arcs]
+        first = np.repeat(arcs, per_arc)
+        second = first + 1 + np.arange(int(per_arc.sum())) - np.repeat(np.cumsum(per_arc) - per_arc, per_arc)
+        v, w = targets[first], targets[second]
+        wedge_keys = v * n + w
+        found = np.minimum(np.searchsorted(sorted_keys, wedge_keys), len(sorted_keys) - 1)
+        closed = sorted_keys[found] == wedge_keys
+        for ends in (sources[first[closed]], v[closed], w[closed]):
+            counts += np.bincount(ends, minlength=n)
+        block_start = block_end
+    return counts
+
+
+def triangle_counts(graph):
+    csr = as_csr(graph)
+    return dict(zip(csr.labels, _triangle_counts(csr).tolist()))
+
+
+def triangle_count(graph):
+    return int(_triangle_counts(as_csr(graph)).sum()) // 3
+
+
+def _degrees(csr):
+    return _simple_undirected(csr).out_degrees().astype(np.float64)
+
+
+def clustering(graph):
+    csr = as_csr(graph)
+    triangles = _triangle_counts(csr)
+    degree = _degrees(csr)
+    possible = degree * (degree - 1)
+    values = np.divide(2 * triangles, possible, out=np.zeros(len(possible)), where=possible > 0)
+    return dict(zip(csr.labels, values.tolist()))
+
+
+def average_clustering(graph):
+    values = list(clustering(graph).values())
+    return sum(values) / len(values) if values else 0.0
+
+
+def transitivity(graph):
+    csr = as_csr(graph)
+    degree = _degrees(csr)
+    wedges = float((degree * (degree - 1)).sum())
+    return 2 * float(_triangle_counts(csr).sum()) / wedges if wedges else 0.0
+
+
+def _core_numbers(csr):
+    simple = _simple_undirected(csr)
+    n = simple.num_vertices
+    offsets, targets = simple.offsets.tolist(), simple.targets.tolist()
+    degree = simple.out_degrees().tolist()
+    if n == 0:
+        return []
+
+    # Batagelj-Zaversnik: vertices sorted by degree with bin starts, so moving a
+    # vertex down one bin is a swap with the first vertex of its bin.
+    max_degree = max(degree)
+    bin_start = [0] * (max_degree + 2)
+    for d in degree:
+        bin_start[d + 1] += 1
+    for d in range(1, max_degree + 2):
+        bin_start[d] += bin_start[d - 1]
+    position = [0] * n
+    vertices = [0] * n
+    fill = bin_start[:]
+    for v in range(n):
+        position[v] = fill[degree[v]]
+        vertices[position[v]] = v
+        fill[degree[v]] += 1
+
+    for i in range(n):
+        v = vertices[i]
+        for k in range(offsets[v], offsets[v + 1]):
+            u = targets[k]
+            if degree[u] > degree[v]:
+                du = degree[u]
+                pu, pw = position[u], bin_start[du]
+                w = vertices[pw]
+                if u != w:
+                    position[u], position[w] = pw, pu
+                    vertices[pu], vertices[pw] = w, u
+                bin_start[du] += 1
+                degree[u] = du - 1
+    return degree
+
+
+def core_numbers(graph):
+    csr = as_csr(graph)
+    return dict(zip(csr.labels, _core_numbers(csr)))
+
+
+def k_core(graph, k):
+    csr = as_csr(graph)
+    labels = csr.labels
+    return induced_subgraph(graph, [labels[v] for v, core in enumerate(_core_numbers(csr)) if core >= k])
+
+
+if __name__ == '__main__':
+    from .basics import Graph
+
+    g = Graph()
+    for u, v in [('A', 'B'), ('A', 'C'), ('B', 'C'), ('B', 'D'), ('C', 'D'), ('D', 'E'), ('E', 'F')]:
+        g.add_edge(u, v)
+
+    print(f"Triangles per vertex: {triangle_counts(g)}")
+    print(f"Total triangles: {triangle_count(g)}")
+    print(f"Clustering: {clustering(g)}")
+    print(f"Average clustering: {average_clustering(g):.4f}, transitivity: {transitivity(g):.4f}")
+    print(f"Core numbers: {core_numbers(g)}")
+    print(f"2-core vertices: {k_core(g, 2).get_vertices()}")
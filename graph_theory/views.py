@@ -0,0 +1,147 @@
+import numpy as np
+
+from .csr import CSRGraph, as_csr
+
+
+def _twin_positions(csr):
+    # Position of the reverse arc (v, u) for every arc (u, v), or -1 if it is missing.
+    sources, targets = csr.sources().astype(np.int64), csr.targets.astype(np.int64)
+    if not len(targets):
+        return targets
+    keys = sources * csr.num_vertices + targets
+    order = np.argsort(keys, kind='stable')
+    reverse_keys = targets * csr.num_vertices + sources
+    found = order[np.minimum(np.searchsorted(keys[order], reverse_keys), len(keys) - 1)]
+    return np.where(keys[found] == reverse_keys, found, -1)
+
+
+def _mirror_positions(csr):
+    # Arcs whose keep/drop decision is copied from their twin rather than asked of the filter.
+    twins = csr.derived('twin_positions', _twin_positions)
+    return (csr.sources() > csr.targets) & (twins >= 0)
+
+
+class SubgraphView:
+    def __init__(self, graph, vertices=None, vertex_filter=None, edge_filter=None):
+        self.graph = graph
+        self._vertices = None if vertices is None else set(vertices)
+        self._vertex_filter = vertex_filter
+        self._edge_filter = edge_filter
+        self._csr = None
+        self._csr_version = None
+
+    @property
+    def directed(self):
+        return self.graph.directed
+
+    def _vertex_mask(self, csr):
+        if self._vertices is None and self._vertex_filter is None:
+            return np.ones(csr.num_vertices, dtype=bool)
+        labels = csr.labels
+        if self._vertices is not None:
+            mask = np.fromiter((label in self._vertices for label in labels), dtype=bool, count=csr.num_vertices)
+        else:
+            mask = np.ones(csr.num_vertices, dtype=bool)
+        if self._vertex_filter is not None:
+            mask &= np.fromiter((bool(self._vertex_filter(label)) for label in labels), dtype=bool,
+                                count=csr.num_vertices)
+        return mask
+
+    def _build(self, csr):
+        keep_vertex = self._vertex_mask(csr)
+        sources, targets = csr.sources(), csr.targets
+        keep = keep_vertex[sources] & keep_vertex[targets]
+        if self._edge_filter is not None:
+            # An undirected edge is stored as two arcs; ask the filter once, on the arc
+            # with source <= target, and give its twin the same answer.
+            mirrored = np.zeros(len(keep), dtype=bool) if csr.directed else _mirror_positions(csr)
+            labels = csr.labels
+            for position in np.flatnonzero(keep & ~mirrored).tolist():
+                u, v = labels[sources[position]], labels[targets[position]]
+                if not self._edge_filter(u, v, csr.edge_weight(position)):
+                    keep[position] = False
+            if not csr.directed:
+                keep[mirrored] = keep[csr.derived('twin_positions', _twin_positions)[mirrored]]
+
+        # Renumber surviving vertices; arcs keep their parent order, so the
+        # arrays are already grouped by source.
+        new_id = np.cumsum(keep_vertex) - 1
+        offsets = np.zeros(int(keep_vertex.sum()) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(new_id[sources[keep]], minlength=len(offsets) - 1), out=offsets[1:])
+        labels = None if csr._index is None else [label for label, k in zip(csr.labels, keep_vertex.tolist()) if k]
+        if labels is None and not keep_vertex.all():
+            labels = np.flatnonzero(keep_vertex).tolist()
+        return CSRGraph(offsets, new_id[targets[keep]], csr.weights[keep], labels, csr.directed)
+
+    def to_csr(self):
+        # Every query goes through a filtered copy of the parent's arrays, which costs
+        # O(V + E) time and memory to build. It is rebuilt only when the parent has
+        # been mutated since the last call.
+        version = getattr(self.graph, 'version', None)
+        if self._csr is None or version != self._csr_version:
+            self._csr = self._build(as_csr(self.graph))
+            self._csr_version = version
+        return self._csr
+
+    def __contains__(self, vertex):
+        return vertex in self.to_csr()
+
+    def __len__(self):
+        return self.to_csr().num_vertices
+
+    def get_vertices(self):
+        return self.to_csr().get_vertices()
+
+    def get_neighbors(self, vertex):
+        return self.to_csr().get_neighbors(vertex)
+
+    def get_edges(self):
+        return self.to_csr().get_edges()
+
+    def get_degree(self, vertex):
+        return self.to_csr().get_degree(vertex)
+
+    def get_edge_weight(self, start, end):
+        return self.to_csr().get_edge_weight(start, end)
+
+    def __str__(self):
+        csr = self.to_csr()
+        res = f"SubgraphView ({'Directed' if self.directed else 'Undirected'}):\n"
+        res += f" Vertices: {csr.num_vertices}\n"
+        res += f" Edges: {csr.num_edges}\n"
+        return res
+
+
+def induced_subgraph(graph, vertices):
+    return SubgraphView(graph, vertices=vertices)
+
+
+def edge_subgraph(graph, edges):
+    wanted = set()
+    for edge in edges:
+        wanted.add((edge[0], edge[1]))
+        if not graph.directed:
+            wanted.add((edge[1], edge[0]))
+    return SubgraphView(graph, edge_filter=lambda u, v, weight: (u, v) in wanted)
+
+
+def filtered_subgraph(graph, vertex_filter=None, edge_filter=None):
+    return SubgraphView(graph, vertex_filter=vertex_filter, edge_filter=edge_filter)
+
+
+if __name__ == '__main__':
+    from .algorithms import find_connected_components
+    from .basics import Graph
+
+    g = Graph()
+    for u, v, w in [('A', 'B', 1), ('B', 'C', 5), ('C', 'D', 1), ('D', 'A', 7), ('A', 'C', 2)]:
+        g.add_edge(u, v, w)
+
+    triangle = induced_subgraph(g, ['A', 'B', 'C'])
+    print(triangle)
+    print(f"Induced edges: {triangle.get_edges()}")
+    light = filtered_subgraph(g, edge_filter=lambda u, v, w: w < 5)
+    print(f"Light edges: {light.get_edges()}")
+    print(f"Components of light subgraph: {find_connected_components(light)}")
+    g.add_edge('B', 'D', 3)
+    print(f"After mutating the parent: {light.get_edges()}")
@@ -0,0 +1,189 @@
+import math
+
+import numpy as np
+
+try:
+    from scipy import sparse
+    HAS_SCIPY = True
+except ImportError:
+    HAS_SCIPY = False
+
+_INT64_SAFE = float(2 ** 62)
+# Row queries take at most max(n, _ROW_STEPS) vector steps before switching to squaring.
+_ROW_STEPS = 64
+
+
+def _is_sparse(matrix):
+    return HAS_SCIPY and sparse.issparse(matrix)
+
+
+def _to_exact(matrix):
+    if _is_sparse(matrix):
+        matrix = sparse.csr_matrix(matrix)
+        data = matrix.data
+    else:
+        matrix = np.asarray(matrix)
+        data = matrix
+    if matrix.ndim != 2 or matrix.shape[0] != matrix.shape[1]:
+        raise ValueError("Adjacency matrix must be square")
+    if data.dtype == object or np.issubdtype(data.dtype, np.integer) or data.dtype == bool:
+        return matrix.astype(np.int64) if data.dtype != object else matrix
+    if not np.all(np.isfinite(data)) or not np.all(data == np.round(data)):
+        return None
+    if len(data.ravel()) and np.abs(data).max() >= 2 ** 53:
+        raise ValueError("Entries too large to represent exactly")
+    return matrix.astype(np.int64)
+
+
+def _row_bound(matrix):
+    if _is_sparse(matrix):
+        # Cast first: sparse sums accumulate in the input dtype and would wrap.
+        sums = np.asarray(abs(matrix).astype(np.float64).sum(axis=1)).ravel()
+    else:
+        sums = np.abs(matrix).sum(axis=1, dtype=np.float64)
+    return float(sums.max(initial=0))
+
+
+def _max_abs(matrix):
+    data = matrix.data if _is_sparse(matrix) else matrix
+    return float(np.abs(data).max(initial=0))
+
+
+def _densify_object(matrix):
+    return (matrix.toarray() if _is_sparse(matrix) else np.asarray(matrix)).astype(object)
+
+
+def _mod(matrix, modulus):
+    if modulus is None:
+        return matrix
+    if _is_sparse(matrix):
+        matrix = matrix.copy()
+        matrix.data %= int(modulus)
+        matrix.eliminate_zeros()
+        return matrix
+    return matrix % int(modulus)
+
+
+def _limb(matrix, shift, mask):
+    if _is_sparse(matrix):
+        matrix = matrix.copy()
+        matrix.data = (matrix.data >> shift) & mask
+        matrix.eliminate_zeros()
+        return matrix
+    return (matrix >> shift) & mask
+
+
+def _split_multiply(a, b, modulus):
+    # Both sides are reduced, so b can be cut into limbs narrow enough that
+    # a @ limb, and the running sum shifted by one limb, both fit in int64.
+    bits = int(min(math.log2(_INT64_SAFE / max(_row_bound(a), 1.0)), math.log2(_INT64_SAFE / modulus)))
+    if bits < 1:
+        return None
+    mask = (1 << bits) - 1
+    result = None
+    for shift in reversed(range(0, int(_max_abs(b)).bit_length(), bits)):
+        partial = _mod(a @ _limb(b, shift, mask), modulus)
+        result = partial if result is None else _mod(_mod(result * (1 << bits), modulus) + partial, modulus)
+    return result
+
+
+def _multiply(a, b, modulus):
+    if a.dtype != object and b.dtype != object:
+        if _row_bound(a) * _max_abs(b) < _INT64_SAFE:
+            return _mod(a @ b, modulus)
+        if modulus is not None:
+            product = _split_multiply(a, b, int(modulus))
+            if product is not None:
+                return product
+    # Switch to Python integers before any entry of a @ b could exceed int64.
+    a, b = _densify_object(a), _densify_object(b)
+    return _mod(a @ b, modulus)
+
+
+def _identity_like(matrix):
+    n = matrix.shape[0]
+    if _is_sparse(matrix):
+        return sparse.identity(n, dtype=np.int64, format='csr')
+    return np.identity(n, dtype=matrix.dtype)
+
+
+def _check_arguments(length, modulus):
+    length = int(length)
+    if length < 0:
+        raise ValueError("Walk length must be non-negative")
+    if modulus is not None and int(modulus) < 1:
+        raise ValueError("Modulus must be a positive integer")
+    return length
+
+
+def walk_count_matrix(adjacency, length, modulus=None):
+    length = _check_arguments(length, modulus)
+    exact = _to_exact(adjacency)
+    if exact is None:
+        dense = adjacency.toarray() if _is_sparse(adjacency) else np.asarray(adjacency, dtype=float)
+        return np.linalg.matrix_power(dense, length)
+
+    base = _mod(exact, modulus)
+    result = _mod(_identity_like(base), modulus)
+    while length:
+        if length & 1:
+            result = _multiply(result, base, modulus)
+        length >>= 1
+        if length:
+            base = _multiply(base, base, modulus)
+    return result
+
+
+def walk_count_row(adjacency, source, length, modulus=None):
+    length = _check_arguments(length, modulus)
+    exact = _to_exact(adjacency)
+    if exact is None:
+        raise ValueError("Walk counts need integer adjacency entries")
+    n = exact.shape[0]
+    if not (0 <= source < n):
+        raise ValueError('Invalid node index')
+
+    if length > max(n, _ROW_STEPS):
+        # Stepping costs one product per unit of length, so long walks square
+        # the matrix instead and only ever multiply the single row into it.
+        row = np.zeros((1, n), dtype=exact.dtype)
+        row[0, source] = 1
+        base = _mod(exact, modulus)
+        while length:
+            if length & 1:
+                row = _multiply(row, base, modulus)
+            length >>= 1
+            if length:
+                base = _multiply(base, base, modulus)
+                # Powers fill in quickly; past half full a dense product is cheaper.
+                if _is_sparse(base) and base.nnz > n * n // 2:
+                    base = base.toarray()
+        return np.asarray(row).ravel()
+
+    transposed = exact.T.tocsr() if _is_sparse(exact) else exact.T
+    column_bound = _row_bound(transposed)
+    vector = np.zeros(n, dtype=exact.dtype)
+    vector[source] = 1
+    for _ in range(length):
+        if vector.dtype != object and _max_abs(vector) * column_bound >= _INT64_SAFE:
+            vector = vector.astype(object)
+            transposed = _densify_object(transposed)
+        vector = _mod(transposed @ vector, modulus)
+    return vector
+
+
+def to_nested_list(matrix):
+    if _is_sparse(matrix):
+        matrix = matrix.toarray()
+    return np.asarray(matrix).tolist()
+
+
+if __name__ == '__main__':
+    path = [[0, 1, 0], [1, 0, 1], [0, 1, 0]]
+    print(f"Walks of length 4 in a path graph:\n{walk_count_matrix(path, 4)}")
+
+    complete = np.ones((4, 4), dtype=np.int64) - np.identity(4, dtype=np.int64)
+    big = walk_count_matrix(complete, 60)
+    print(f"Walks of length 60 in K4 (exceeds int64): {big[0, 0]}")
+    print(f"Same count mod 1_000_000_007: {walk_count_matrix(complete, 60, modulus=1_000_000_007)[0, 0]}")
+    print(f"Row 0 only: {walk_count_row(complete, 0, 60)}")
@@ -0,0 +1,7 @@
+import pytest
+
+
+@pytest.fixture(scope='session')
+def client():
+    web_app = pytest.importorskip('web_app')
+    return web_app.app.test_client()
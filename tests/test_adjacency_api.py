@@ -0,0 +1,57 @@
+import numpy as np
+import pytest
+
+MATRIX = np.array([[0, 1, 0, 2],
+                   [0, 0, 1, 0],
+                   [1, 0, 0, 0],
+                   [0, 1, 0, 0]])
+# The same matrix as COO with a duplicate entry and an explicit zero.
+COO = {'row': [0, 0, 0, 1, 2, 3, 2], 'col': [1, 3, 3, 2, 0, 1, 3], 'data': [1, 1, 1, 1, 1, 1, 0], 'shape': [4, 4]}
+
+
+def expected(node, directed):
+    out_row, in_row = MATRIX[node], MATRIX[:, node]
+    if directed:
+        return ({'in_degree': int(in_row.sum()), 'out_degree': int(out_row.sum()), 'total': int(in_row.sum() + out_row.sum())},
+                {'out_neighbors': np.flatnonzero(out_row).tolist(), 'in_neighbors': np.flatnonzero(in_row).tolist()})
+    return ({'degree': int(in_row.sum() + out_row.sum())},
+            {'neighbors': np.union1d(np.flatnonzero(out_row), np.flatnonzero(in_row)).tolist()})
+
+
+def node_queries(client, source, node, directed):
+    results = []
+    for endpoint in ('degree', 'neighbors'):
+        response = client.post(f'/api/adjacency_matrix/{endpoint}', json={**source, 'node': node, 'directed': directed})
+        assert response.status_code == 200, response.get_json()
+        results.append(response.get_json()['result'])
+    return tuple(results)
+
+
+@pytest.mark.parametrize('directed', [True, False])
+def test_inline_payloads(client, directed):
+    csr = {'indptr': [0, 2, 3, 4, 5], 'indices': [1, 3, 2, 0, 1], 'data': [1, 2, 1, 1, 1]}
+    for source in ({'matrix': MATRIX.tolist()}, {'coo': COO}, {'csr': csr}):
+        for node in range(4):
+            assert node_queries(client, source, node, directed) == expected(node, directed)
+
+
+def test_stored_matrix(client):
+    response = client.post('/api/graph/store', json={'coo': COO})
+    handle = response.get_json()['result']['handle']
+    for node in range(4):
+        assert node_queries(client, {'graph_handle': handle}, node, True) == expected(node, True)
+
+    response = client.post('/api/adjacency_matrix/degree', json={'graph_handle': 'missing', 'node': 0})
+    assert response.status_code == 404
+
+
+def test_column_copy_built_once(client, monkeypatch):
+    import web_app
+
+    handle = client.post('/api/graph/store', json={'matrix': (MATRIX * 3).tolist()}).get_json()['result']['handle']
+    built = []
+    columns = web_app._columns
+    monkeypatch.setattr(web_app, '_columns', lambda adj: built.append(1) or columns(adj))
+    for node in range(4):
+        node_queries(client, {'graph_handle': handle}, node, False)
+    assert len(built) == 1
@@ -0,0 +1,91 @@
+import pytest
+
+from graph_theory.algorithms import (COLOURING_STRATEGIES, bidirectional_dijkstra, chromatic_number, critical_path,
+                                     dijkstra, eulerian_circuit, eulerian_path, greedy_colouring, hamiltonian_cycle,
+                                     has_eulerian_circuit, iter_topological_sorts, kruskal_mst, topological_sort)
+from graph_theory.basics import Graph
+from graph_theory.centrality import betweenness_centrality
+from graph_theory.routing import a_star
+
+
+def build(edges, directed=False):
+    g = Graph(directed=directed)
+    for u, v in edges:
+        g.add_edge(u, v)
+    return g
+
+
+@pytest.fixture
+def wheel():
+    # Hub 0 joined to an odd rim 1..5, so three colours are not enough.
+    return build([(0, spoke) for spoke in range(1, 6)] + [(spoke, spoke % 5 + 1) for spoke in range(1, 6)])
+
+
+def is_proper(graph, colouring):
+    return all(colouring[edge[0]] != colouring[edge[1]] for edge in graph.get_edges())
+
+
+def test_topological_sorts():
+    dag = build([(1, 2), (1, 3), (2, 3)], directed=True)
+    assert topological_sort(dag) == [1, 2, 3]
+    assert topological_sort(dag, method='dfs') == [1, 2, 3]
+    assert list(iter_topological_sorts(dag)) == [[1, 2, 3]]
+    with pytest.raises(ValueError):
+        topological_sort(build([(1, 2), (2, 3), (3, 1)], directed=True))
+
+
+def test_critical_path():
+    tasks = build([('design', 'build'), ('design', 'docs'), ('build', 'test'), ('docs', 'release'),
+                   ('test', 'release')], directed=True)
+    schedule = critical_path(tasks, durations={'design': 3, 'build': 5, 'docs': 2, 'test': 4, 'release': 1})
+    assert schedule['path'] == ['design', 'build', 'test', 'release']
+    assert schedule['length'] == 13
+    assert schedule['slack'] == {'design': 0, 'build': 0, 'docs': 7, 'test': 0, 'release': 0}
+
+
+def test_colouring(wheel):
+    for strategy in COLOURING_STRATEGIES:
+        assert is_proper(wheel, greedy_colouring(wheel, strategy))
+    colours, colouring = chromatic_number(wheel)
+    assert colours == 4
+    assert is_proper(wheel, colouring)
+
+
+def test_hamiltonian_cycle(wheel):
+    cycle = hamiltonian_cycle(wheel)
+    assert cycle[0] == cycle[-1] and sorted(cycle[:-1]) == list(range(6))
+    assert all(v in wheel.get_neighbors(u) for u, v in zip(cycle, cycle[1:]))
+
+
+def test_eulerian(wheel):
+    # Every rim vertex has odd degree, so there is neither a path nor a circuit.
+    assert not has_eulerian_circuit(wheel)
+    assert eulerian_path(wheel) == []
+    square = build([(1, 2), (2, 3), (3, 4), (4, 1)])
+    circuit = eulerian_circuit(square)
+    assert circuit[0] == circuit[-1] and len(circuit) == 5
+
+
+def test_kruskal_disconnected_returns_forest(capsys):
+    g = Graph()
+    for u, v, w in [(1, 2, 3), (2, 3, 1), (1, 3, 2), (4, 5, 7)]:
+        g.add_edge(u, v, w)
+    edges, total = kruskal_mst(g)
+    assert len(edges) == 3
+    assert total == 10
+    assert capsys.readouterr().out == ''
+
+
+def test_dijkstra_ignores_unreachable_negative_edge():
+    g = Graph(directed=True)
+    for u, v, w in [('a', 'b', 2), ('b', 'c', 1), ('x', 'y', -5)]:
+        g.add_edge(u, v, w)
+    assert dijkstra(g, 'a')[0] == {'a': 0, 'b': 2, 'c': 3}
+    assert bidirectional_dijkstra(g, 'a', 'c') == (3, ['a', 'b', 'c'])
+    assert a_star(g, 'a', 'c') == (3, ['a', 'b', 'c'])
+
+    g.add_edge('c', 'x', 1)
+    for search in (lambda: dijkstra(g, 'a'), lambda: bidirectional_dijkstra(g, 'a', 'y'),
+                   lambda: a_star(g, 'a', 'y'), lambda: betweenness_centrality(g, weighted=True)):
+        with pytest.raises(ValueError, match='negative edge weights'):
+            search()
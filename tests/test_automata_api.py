@@ -0,0 +1,21 @@
+PARITY = {
+    'states': ['even', 'odd'],
+    'alphabet': ['0', '1'],
+    'transitions': {'even,0': 'even', 'even,1': 'odd', 'odd,0': 'odd', 'odd,1': 'even'},
+    'start_state': 'even',
+    'accept_states': ['even'],
+}
+
+
+def test_dfa_batch(client):
+    strings = ['', '1', '11', '101', '0110'] + ['1' * 7] * 20
+    response = client.post('/api/automata/batch_test', json={'type': 'dfa', 'automaton': PARITY, 'strings': strings})
+    assert response.status_code == 200, response.get_json()
+    result = response.get_json()['result']
+    assert [r['string'] for r in result] == strings
+    assert [r['accepted'] for r in result] == [s.count('1') % 2 == 0 for s in strings]
+
+
+def test_dfa_batch_rejects_unknown_symbol(client):
+    response = client.post('/api/automata/batch_test', json={'type': 'dfa', 'automaton': PARITY, 'strings': ['012']})
+    assert response.status_code == 400
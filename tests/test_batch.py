@@ -0,0 +1,49 @@
+import pytest
+
+import graph_theory.batch
+from graph_theory.basics import Graph
+from graph_theory.batch import run_batch
+
+
+@pytest.fixture
+def graph():
+    g = Graph()
+    for u, v, w in [('A', 'B', 4), ('A', 'C', 2), ('C', 'D', 3)]:
+        g.add_edge(u, v, w)
+    return g
+
+
+def queries(count):
+    return [{'operation': 'bfs', 'start_node': 'ABCD'[i % 4]} for i in range(count)] + [{'operation': 'unknown'}]
+
+
+def test_serial_by_default(graph, monkeypatch):
+    def no_pool(*args, **kwargs):
+        raise AssertionError('run_batch started a process pool')
+
+    monkeypatch.setattr(graph_theory.batch, 'ProcessPoolExecutor', no_pool)
+    results = list(run_batch(graph, queries(200)))
+    assert [r['index'] for r in results] == list(range(201))
+    assert results[-1] == {'index': 200, 'error': "Unknown operation 'unknown'"}
+
+
+def test_pool_matches_serial(graph):
+    serial = list(run_batch(graph, queries(100)))
+    pooled = sorted(run_batch(graph, queries(100), processes=2), key=lambda r: r['index'])
+    assert pooled == serial
+
+
+def test_endpoint_uses_configured_processes(client, monkeypatch):
+    import web_app
+
+    seen = []
+
+    def fake_run_batch(graph, queries, processes=1):
+        seen.append(processes)
+        return iter(())
+
+    monkeypatch.setattr(web_app, 'run_batch', fake_run_batch)
+    response = client.post('/api/graph_theory/batch', json={'graph': {'edges': []}, 'queries': []})
+    response.get_data()
+    assert seen == [web_app.BATCH_PROCESSES]
+    assert 1 <= web_app.BATCH_PROCESSES
@@ -0,0 +1,35 @@
+GRAPH = {'edges': [{'u': 'a', 'v': 'b'}, {'u': 'b', 'v': 'c'}]}
+
+
+def test_layout_cytoscape(client):
+    response = client.post('/api/graph/layout', json={'graph': GRAPH, 'iterations': 10, 'seed': 3})
+    assert response.status_code == 200, response.get_json()
+    data = response.get_json()
+    assert sorted(node['data']['id'] for node in data['result']['nodes']) == ['a', 'b', 'c']
+    assert all('position' in node for node in data['result']['nodes'])
+
+    handle = client.post('/api/graph/store', json={'graph': GRAPH}).get_json()['result']['handle']
+    stored = client.post('/api/graph/layout', json={'graph_handle': handle, 'iterations': 10, 'seed': 3})
+    assert stored.get_json() == {'result': data['result'], 'graph_handle': handle}
+
+
+def test_inline_layout_leaves_store_alone(client):
+    import web_app
+
+    before = len(web_app.graph_store)
+    graph = {'edges': [{'u': 'x', 'v': 'y'}]}
+    response = client.post('/api/graph/layout', json={'graph': graph, 'seed': 1})
+    assert response.status_code == 200
+    assert 'graph_handle' not in response.get_json()
+    assert len(web_app.graph_store) == before
+    assert len(web_app.layout_cache) >= 1
+
+
+def test_layout_unknown_format(client):
+    response = client.post('/api/graph/layout', json={'graph': {'edges': []}, 'format': 'gif'})
+    assert response.status_code == 400
+
+
+def test_layout_unknown_handle(client):
+    response = client.post('/api/graph/layout', json={'graph_handle': 'missing'})
+    assert response.status_code == 404
@@ -0,0 +1,153 @@
+import json
+import re
+
+import pytest
+
+import graph_theory.batch
+from graph_theory.batch import QUERY_OPTIONS
+
+
+def graph(edges, directed=False):
+    return {'directed': directed, 'edges': [{'u': u, 'v': v, 'weight': w} for u, v, w in edges]}
+
+
+DAG = graph([('a', 'b', 2), ('b', 'c', 3), ('a', 'c', 1)], directed=True)
+SQUARE = graph([('a', 'b', 1), ('b', 'c', 1), ('c', 'd', 1), ('d', 'a', 1)])
+TRIANGLE = graph([('a', 'b', 1), ('b', 'c', 1), ('c', 'a', 1)])
+
+
+def query(client, operation, graph, **options):
+    response = client.post('/api/graph_theory', json={'operation': operation, 'graph': graph, **options})
+    assert response.status_code == 200, response.get_json()
+    return response.get_json()['result']
+
+
+def test_dijkstra(client):
+    result = query(client, 'dijkstra', DAG, start_node='a', end_node='c', max_distance=5, k=3)
+    assert result['distances']['c'] == 1
+    assert result['predecessors']['c'] == 'a'
+
+
+def test_unknown_operation(client):
+    response = client.post('/api/graph_theory', json={'operation': 'nope', 'graph': SQUARE})
+    assert response.status_code == 400
+
+
+def test_unknown_operation_skips_graph(client, monkeypatch):
+    import web_app
+
+    def fail(data):
+        raise AssertionError('graph resolved for an unknown operation')
+
+    monkeypatch.setattr(web_app, 'resolve_graph', fail)
+    response = client.post('/api/graph_theory', json={'operation': 'nope', 'graph': SQUARE})
+    assert response.get_json() == {'error': 'Unknown operation'}
+    for queries in ({'operation': 'bfs'}, [{'operation': 'bfs'}, 'bfs']):
+        response = client.post('/api/graph_theory/batch', json={'graph': SQUARE, 'queries': queries})
+        assert response.get_json() == {'error': 'queries must be a list of objects'}
+
+
+def test_unknown_option_rejected(client):
+    response = client.post('/api/graph_theory', json={'operation': 'bfs', 'graph': SQUARE, 'bogus': 1})
+    assert response.status_code == 400
+
+
+def test_batch_streams_one_line_per_query(client):
+    queries = [{'operation': 'bfs', 'start_node': 'a'}, {'operation': 'nope'}]
+    response = client.post('/api/graph_theory/batch', json={'graph': DAG, 'queries': queries})
+    assert response.mimetype == 'application/x-ndjson'
+    lines = sorted((json.loads(line) for line in response.get_data(as_text=True).splitlines()),
+                   key=lambda line: line['index'])
+    assert lines[0] == {'index': 0, 'result': ['a', 'b', 'c']}
+    assert 'error' in lines[1]
+
+
+def test_topological_sort_method(client):
+    assert query(client, 'topological_sort', DAG, method='dfs') == ['a', 'b', 'c']
+
+
+def test_dag_longest_path(client):
+    assert query(client, 'dag_longest_path', DAG) == {'length': 5, 'path': ['a', 'b', 'c']}
+
+
+def test_critical_path_durations(client):
+    result = query(client, 'critical_path', DAG, durations={'a': 1, 'b': 2, 'c': 3})
+    assert result['path'] == ['a', 'b', 'c']
+    assert result['slack'] == {'a': 0, 'b': 0, 'c': 0}
+
+
+def test_max_flow_method(client):
+    for method in ('dinic', 'push_relabel'):
+        result = query(client, 'max_flow', DAG, start_node='a', end_node='c', method=method)
+        assert result['value'] == 3
+        assert result['source_side'] == ['a']
+
+
+def test_bipartite_witnesses(client):
+    assert query(client, 'bipartite', SQUARE)['bipartite'] is True
+    assert sorted(query(client, 'bipartite', TRIANGLE)['odd_cycle']) == ['a', 'b', 'c']
+
+
+def test_maximum_matching_left(client):
+    assert sorted(query(client, 'maximum_matching', SQUARE, left=['a', 'c'])) == [['a', 'b'], ['c', 'd']]
+
+
+def test_pagerank_options(client):
+    result = query(client, 'pagerank', DAG, damping=0.9, weighted=True)
+    assert abs(sum(result.values()) - 1) < 1e-6
+    assert max(result, key=result.get) == 'c'
+
+
+def test_betweenness_sampling(client):
+    result = query(client, 'betweenness', SQUARE, k=2, seed=1, weighted=False)
+    assert set(result) == {'a', 'b', 'c', 'd'}
+
+
+def test_closeness(client):
+    assert query(client, 'closeness', SQUARE, weighted=True) == {v: 0.75 for v in 'abcd'}
+
+
+def test_colouring_strategy(client):
+    assert query(client, 'colouring', SQUARE, strategy='largest_first')['colours'] == 2
+
+
+def test_colouring_exact(client):
+    assert query(client, 'colouring', TRIANGLE, exact=True)['colours'] == 3
+
+
+def test_triangles_clustering_cores(client):
+    assert query(client, 'triangles', TRIANGLE) == {'a': 1, 'b': 1, 'c': 1}
+    assert query(client, 'clustering', SQUARE) == {v: 0.0 for v in 'abcd'}
+    assert query(client, 'core_numbers', SQUARE) == {v: 2 for v in 'abcd'}
+
+
+def test_eulerian_circuit(client):
+    circuit = query(client, 'eulerian', SQUARE, circuit=True)
+    assert circuit[0] == circuit[-1] and len(circuit) == 5
+
+
+def test_hamiltonian_cycle(client):
+    cycle = query(client, 'hamiltonian', SQUARE, cycle=True)
+    assert cycle[0] == cycle[-1] and sorted(cycle[:-1]) == ['a', 'b', 'c', 'd']
+    assert len(query(client, 'hamiltonian', DAG, cycle=False)) == 3
+
+
+SAMPLES = {object: 'a', str: 'x', int: 1, float: 0.5, bool: True, dict: {}, list: []}
+
+
+@pytest.mark.parametrize('name', sorted(QUERY_OPTIONS))
+def test_query_option_accepted(client, name):
+    options = {name: SAMPLES[QUERY_OPTIONS[name]]}
+    assert query(client, 'connected_components', SQUARE, **options) == [['a', 'b', 'c', 'd']]
+
+
+def test_query_option_types_checked(client):
+    response = client.post('/api/graph_theory', json={'operation': 'bfs', 'graph': SQUARE, 'k': 'many'})
+    assert response.status_code == 400
+    assert 'k' in response.get_json()['error']
+
+
+def test_query_options_match_operations():
+    with open(graph_theory.batch.__file__) as f:
+        read = set(re.findall(r"query\.get\('(\w+)'", f.read())) - {'operation'}
+    assert read == set(QUERY_OPTIONS)
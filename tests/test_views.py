@@ -0,0 +1,43 @@
+from graph_theory.basics import Graph
+from graph_theory.triangles import triangle_count
+from graph_theory.views import edge_subgraph, filtered_subgraph, induced_subgraph
+
+
+def build(edges, directed=False):
+    g = Graph(directed=directed)
+    for u, v, w in edges:
+        g.add_edge(u, v, w)
+    return g
+
+
+SQUARE = [('A', 'B', 1), ('B', 'C', 5), ('C', 'D', 1), ('D', 'A', 7), ('A', 'C', 2)]
+
+
+def test_one_sided_filter_drops_whole_undirected_edge():
+    g = build(SQUARE)
+    calls = []
+    view = filtered_subgraph(g, edge_filter=lambda u, v, w: calls.append((u, v)) or (u, v) != ('A', 'B'))
+    assert 'B' not in view.get_neighbors('A')
+    assert 'A' not in view.get_neighbors('B')
+    assert len(calls) == len(SQUARE)
+    csr = view.to_csr()
+    arcs = set(zip(csr.sources().tolist(), csr.targets.tolist()))
+    assert all((v, u) in arcs for u, v in arcs)
+
+
+def test_directed_filter_sees_every_arc():
+    g = build([('A', 'B', 1), ('B', 'A', 2)], directed=True)
+    view = filtered_subgraph(g, edge_filter=lambda u, v, w: u == 'A')
+    assert view.get_neighbors('A') == ['B']
+    assert view.get_neighbors('B') == []
+
+
+def test_views_follow_parent():
+    g = build(SQUARE)
+    light = filtered_subgraph(g, edge_filter=lambda u, v, w: w < 5)
+    assert sorted(tuple(sorted(e[:2])) for e in light.get_edges()) == [('A', 'B'), ('A', 'C'), ('C', 'D')]
+    g.add_edge('B', 'D', 3)
+    assert 'D' in light.get_neighbors('B')
+
+    assert triangle_count(induced_subgraph(g, ['A', 'B', 'C'])) == 1
+    assert sorted(edge_subgraph(g, [('B', 'A')]).get_neighbors('A')) == ['B']
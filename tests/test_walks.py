@@ -0,0 +1,40 @@
+import numpy as np
+import pytest
+from scipy import sparse
+
+from graph_theory.walks import walk_count_matrix, walk_count_row
+
+CYCLE = np.roll(np.identity(5, dtype=np.int64), 1, axis=1) + np.roll(np.identity(5, dtype=np.int64), -1, axis=1)
+
+
+@pytest.mark.parametrize('length', [0, 3, 70, 1000])
+@pytest.mark.parametrize('modulus', [None, 1_000_000_007])
+def test_row_matches_matrix(length, modulus):
+    expected = np.asarray(walk_count_matrix(CYCLE, length, modulus))[2]
+    assert walk_count_row(CYCLE, 2, length, modulus).tolist() == expected.tolist()
+    assert walk_count_row(sparse.csr_matrix(CYCLE), 2, length, modulus).tolist() == expected.tolist()
+
+
+def test_row_exceeding_int64_is_exact():
+    complete = np.ones((4, 4), dtype=np.int64) - np.identity(4, dtype=np.int64)
+    row = walk_count_row(complete, 0, 200)
+    assert row[0] == (3 ** 200 + 3) // 4
+
+
+def test_huge_exponent_modular():
+    assert walk_count_row(CYCLE, 0, 10 ** 18, 97).tolist() == walk_count_matrix(CYCLE, 10 ** 18, 97)[0].tolist()
+
+
+@pytest.mark.parametrize('function', [walk_count_matrix, lambda a, n, m: walk_count_row(a, 0, n, m)])
+def test_invalid_arguments(function):
+    with pytest.raises(ValueError):
+        function(CYCLE, 4, 0)
+    with pytest.raises(ValueError):
+        function(CYCLE, -1, None)
+
+
+def test_power_endpoint_row(client):
+    payload = {'matrix': CYCLE.tolist(), 'power': 10 ** 18, 'modulus': 97, 'row': 0}
+    response = client.post('/api/adjacency_matrix/power', json=payload)
+    assert response.status_code == 200, response.get_json()
+    assert response.get_json()['result'] == walk_count_matrix(CYCLE, 10 ** 18, 97)[0].tolist()
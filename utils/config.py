@@ -1,4 +1,7 @@
 import os
 
 MCP_SERVER_URL = os.getenv('MCP_SERVER_URL', 'http://localhost:5001')
-MCP_ENABLED = os.getenv('MCP_ENABLED', 'true').lower() == 'true'
\ No newline at end of file
+MCP_ENABLED = os.getenv('MCP_ENABLED', 'true').lower() == 'true'
+GRAPH_STORE_MAX_BYTES = int(os.getenv('GRAPH_STORE_MAX_BYTES', str(512 * 1024 * 1024)))
+GRAPH_BATCH_PROCESSES = int(os.getenv('GRAPH_BATCH_PROCESSES', '1'))
+GRAPH_LAYOUT_CACHE_BYTES = int(os.getenv('GRAPH_LAYOUT_CACHE_BYTES', str(64 * 1024 * 1024)))
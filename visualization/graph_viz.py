@@ -1,63 +1,313 @@
-import matplotlib.pyplot as plt
-import networkx as nx
-
-def visualize_graph(graph, title="Graph Visualization"):
-    nx_graph = nx.DiGraph() if graph.directed else nx.Graph()
-    
-    nx_graph.add_nodes_from(graph.get_vertices())
-    
-    edge_labels = {}
-    for edge in graph.get_edges():
-        if len(edge) == 3:
-            start, end, weight = edge
-            nx_graph.add_edge(start, end, weight=weight)
-            edge_labels[(start, end)] = weight
-        else:
-            start, end = edge
-            nx_graph.add_edge(start, end)
-            
-    pos = nx.spring_layout(nx_graph)
-    
-    plt.figure(figsize=(10, 8))
-    nx.draw(nx_graph, pos, with_labels=True, node_size=700, node_color='skyblue', font_size=10, font_weight='bold', arrows=graph.directed)
-    
-    if edge_labels:
-        nx.draw_networkx_edge_labels(nx_graph, pos, edge_labels=edge_labels)
-        
-    plt.title(title)
+import io
+
+import numpy as np
+
+from graph_theory.csr import as_csr
+
+try:
+    from scipy import sparse
+    from scipy.sparse.linalg import eigsh
+    HAS_SCIPY = True
+except ImportError:
+    HAS_SCIPY = False
+
+# Up to this many vertices repulsion is computed between every pair; above it
+# distant vertices are approximated by the centres of mass of grid cells.
+_EXACT_REPULSION = 1000
+_CHILD_OFFSETS = np.array([(dx, dy) for dx in range(6) for dy in range(6)])
+# Dense eigendecomposition is quicker than ARPACK for small graphs.
+_DENSE_SPECTRAL = 500
+
+
+def _undirected_pairs(csr):
+    # Each undirected edge once, self-loops dropped: both drive a symmetric force.
+    def build(c):
+        sources, targets = c.sources().astype(np.int64), c.targets.astype(np.int64)
+        keep = sources < targets if not c.directed else sources != targets
+        return sources[keep], targets[keep]
+    return csr.derived('layout_pairs', build)
+
+
+def _rescale(positions):
+    # Fit into the unit square, keeping the aspect ratio.
+    if not len(positions):
+        return positions
+    positions = positions - positions.min(axis=0)
+    extent = positions.max()
+    if extent > 0:
+        positions /= extent
+    return positions + (1 - positions.max(axis=0)) / 2
+
+
+def _close_pairs(positions, radius):
+    cells_per_side = max(1, int(1 / radius))
+    cell = np.minimum((positions * cells_per_side).astype(np.int64), cells_per_side - 1)
+    cell_id = cell[:, 0] * cells_per_side + cell[:, 1]
+    order = np.argsort(cell_id, kind='stable')
+    sorted_cells = cell_id[order]
+    starts = np.searchsorted(sorted_cells, np.arange(cells_per_side ** 2))
+    ends = np.searchsorted(sorted_cells, np.arange(cells_per_side ** 2), side='right')
+
+    u_parts, v_parts = [], []
+    for dx, dy in ((0, 0), (1, -1), (1, 0), (1, 1), (0, 1)):
+        nx, ny = cell[:, 0] + dx, cell[:, 1] + dy
+        valid = (nx >= 0) & (nx < cells_per_side) & (ny >= 0) & (ny < cells_per_side)
+        u = np.flatnonzero(valid)
+        neighbour_cell = nx[u] * cells_per_side + ny[u]
+        counts = ends[neighbour_cell] - starts[neighbour_cell]
+        v = order[np.arange(int(counts.sum())) + np.repeat(starts[neighbour_cell] - np.cumsum(counts) + counts, counts)]
+        u = np.repeat(u, counts)
+        keep = u < v if (dx, dy) == (0, 0) else np.ones(len(u), dtype=bool)
+        u_parts.append(u[keep])
+        v_parts.append(v[keep])
+    return np.concatenate(u_parts), np.concatenate(v_parts)
+
+
+def _pair_forces(n, u, v, force):
+    displacement = np.zeros((n, 2))
+    for axis in range(2):
+        displacement[:, axis] = np.bincount(u, force[:, axis], minlength=n) - np.bincount(v, force[:, axis], minlength=n)
+    return displacement
+
+
+def _exact_repulsion(positions, k):
+    delta = positions[:, None, :] - positions[None, :, :]
+    distance2 = np.maximum((delta ** 2).sum(axis=2), 1e-4)
+    return (delta * (k * k / distance2)[:, :, None]).sum(axis=1)
+
+
+def _grid_repulsion(positions, k):
+    # Hierarchical grid over the bounding box. At each level a cell feels the
+    # cells that are children of its parent's neighbours but not its own
+    # neighbours, as point masses at their centroids; the field is evaluated at
+    # the cell's centroid and shared by its vertices. The finest level's
+    # neighbours are handled pair by pair, so every other vertex is counted once.
+    n = len(positions)
+    low = positions.min(axis=0)
+    unit = (positions - low) / max(float((positions.max(axis=0) - low).max()), 1e-9)
+    finest = max(2, int(np.ceil(np.log2(np.sqrt(n / 4)))))
+    displacement = np.zeros((n, 2))
+    for level in range(2, finest + 1):
+        side = 2 ** level
+        cell = np.minimum((unit * side).astype(np.int64), side - 1)
+        cell_id = cell[:, 0] * side + cell[:, 1]
+        mass = np.bincount(cell_id, minlength=side * side).astype(np.float64)
+        centroid = np.stack([np.bincount(cell_id, positions[:, axis], minlength=side * side) for axis in range(2)],
+                            axis=1) / np.maximum(mass, 1)[:, None]
+        occupied = np.flatnonzero(mass)
+        gx, gy = occupied // side, occupied % side
+        cx = ((gx // 2) * 2 - 2)[:, None] + _CHILD_OFFSETS[:, 0]
+        cy = ((gy // 2) * 2 - 2)[:, None] + _CHILD_OFFSETS[:, 1]
+        inside = (cx >= 0) & (cx < side) & (cy >= 0) & (cy < side)
+        far = (np.abs(cx - gx[:, None]) > 1) | (np.abs(cy - gy[:, None]) > 1)
+        other = np.where(inside, cx * side + cy, 0)
+        weight = np.where(inside & far, mass[other], 0.0)
+        delta = centroid[occupied][:, None, :] - centroid[other]
+        distance2 = np.maximum((delta ** 2).sum(axis=2), 1e-4)
+        field = np.zeros((side * side, 2))
+        field[occupied] = (delta * (k * k * weight / distance2)[:, :, None]).sum(axis=1)
+        displacement += field[cell_id]
+
+    u, v = _close_pairs(unit, 1.0 / 2 ** finest)
+    delta = positions[u] - positions[v]
+    return displacement + _pair_forces(n, u, v, delta * (k * k / np.maximum((delta ** 2).sum(axis=1), 1e-4))[:, None])
+
+
+def fruchterman_reingold(graph, iterations=50, seed=0, initial=None):
+    csr = as_csr(graph)
+    n = csr.num_vertices
+    if n == 0:
+        return np.zeros((0, 2))
+    if n == 1:
+        return np.full((1, 2), 0.5)
+    rng = np.random.default_rng(seed)
+    positions = rng.random((n, 2)) if initial is None else _rescale(np.array(initial, dtype=np.float64))
+    sources, targets = _undirected_pairs(csr)
+    k = np.sqrt(1.0 / n)
+    temperature = 0.1 * max(float((positions.max(axis=0) - positions.min(axis=0)).max()), 1e-9)
+    cooling = temperature / (iterations + 1)
+
+    for _ in range(iterations):
+        displacement = _exact_repulsion(positions, k) if n <= _EXACT_REPULSION else _grid_repulsion(positions, k)
+        delta = positions[sources] - positions[targets]
+        displacement -= _pair_forces(n, sources, targets, delta * (np.sqrt((delta ** 2).sum(axis=1)) / k)[:, None])
+
+        # Each vertex moves along its net force, at most `temperature` far.
+        length = np.maximum(np.sqrt((displacement ** 2).sum(axis=1)), 1e-9)
+        positions += displacement * (np.minimum(length, temperature) / length)[:, None]
+        temperature -= cooling
+
+    return _rescale(positions)
+
+
+def spectral_layout(graph):
+    csr = as_csr(graph)
+    n = csr.num_vertices
+    if n <= 2:
+        return np.array([[0.0, 0.5], [1.0, 0.5]])[:n] if n == 2 else np.full((n, 2), 0.5)
+    sources, targets = _undirected_pairs(csr)
+    rows, cols = np.concatenate((sources, targets)), np.concatenate((targets, sources))
+    degree = np.bincount(rows, minlength=n).astype(np.float64)
+    scale = np.divide(1.0, np.sqrt(degree), out=np.zeros(n), where=degree > 0)
+
+    # The leading eigenvectors of D^-1/2 A D^-1/2 after the trivial one are the
+    # smoothest non-constant embeddings (the Laplacian's Fiedler vectors).
+    values = scale[rows] * scale[cols]
+    if HAS_SCIPY and n > _DENSE_SPECTRAL:
+        matrix = sparse.csr_matrix((values, (rows, cols)), shape=(n, n))
+        _, vectors = eigsh(matrix, k=3, which='LA', v0=np.ones(n))
+    else:
+        matrix = np.zeros((n, n))
+        np.add.at(matrix, (rows, cols), values)
+        _, vectors = np.linalg.eigh(matrix)
+        vectors = vectors[:, -3:]
+    return _rescale(vectors[:, [1, 0]] * scale[:, None])
+
+
+LAYOUTS = {
+    'spring': fruchterman_reingold,
+    'spectral': spectral_layout,
+}
+
+
+def _options_key(options):
+    # Array options such as initial positions are unhashable; key them by contents.
+    items = []
+    for name, value in sorted(options.items()):
+        if value is not None and not np.isscalar(value):
+            value = np.asarray(value, dtype=np.float64)
+            value = (value.shape, value.tobytes())
+        items.append((name, value))
+    return tuple(items)
+
+
+def compute_layout(graph, method='spring', **options):
+    if method not in LAYOUTS:
+        raise ValueError(f"Unknown layout '{method}'")
+    csr = as_csr(graph)
+    # Stored with the array form, which is rebuilt whenever the graph mutates,
+    # so positions are reused until the next change to the graph.
+    key = ('layout', method, _options_key(options))
+    return csr.derived(key, lambda c: LAYOUTS[method](c, **options))
+
+
+def layout_positions(graph, method='spring', **options):
+    csr = as_csr(graph)
+    return dict(zip(csr.labels, map(tuple, compute_layout(csr, method, **options).tolist())))
+
+
+def _draw(ax, graph, positions, with_labels=None):
+    from matplotlib.collections import LineCollection
+
+    csr = as_csr(graph)
+    n = csr.num_vertices
+    with_labels = n <= 200 if with_labels is None else with_labels
+    sources, targets = _undirected_pairs(csr)
+    ax.add_collection(LineCollection(np.stack((positions[sources], positions[targets]), axis=1),
+                                     colors='gray', linewidths=1 if n <= 1000 else 0.3, zorder=1))
+    if csr.directed and len(sources) <= 500:
+        for u, v in zip(sources.tolist(), targets.tolist()):
+            ax.annotate('', xy=positions[v], xytext=positions[u],
+                        arrowprops={'arrowstyle': '-|>', 'color': 'gray', 'shrinkA': 12, 'shrinkB': 12})
+    node_size = 700 if n <= 50 else max(2, 20000 / n)
+    ax.scatter(positions[:, 0], positions[:, 1], s=node_size, c='skyblue', zorder=2)
+
+    if with_labels:
+        for label, (x, y) in zip(csr.labels, positions.tolist()):
+            ax.text(x, y, str(label), ha='center', va='center', fontsize=10, fontweight='bold', zorder=3)
+        if len(sources) <= 200:
+            lookup = {(s, t): p for p, (s, t) in enumerate(zip(csr.sources().tolist(), csr.targets.tolist()))}
+            for u, v in zip(sources.tolist(), targets.tolist()):
+                weight = csr.edge_weight(lookup[(u, v)])
+                if weight is not None:
+                    x, y = (positions[u] + positions[v]) / 2
+                    ax.text(x, y, str(weight), ha='center', va='center', fontsize=8, zorder=3,
+                            bbox={'facecolor': 'white', 'edgecolor': 'none', 'pad': 1})
+    ax.set_xlim(-0.05, 1.05)
+    ax.set_ylim(-0.05, 1.05)
+    ax.set_axis_off()
+
+
+def render_graph(graph, fmt='png', method='spring', title=None, figsize=(10, 8), dpi=100, with_labels=None,
+                 **options):
+    if fmt not in ('png', 'svg'):
+        raise ValueError(f"Unsupported image format '{fmt}'")
+    # A bare Figure renders without pyplot, so no GUI backend or global state is involved.
+    from matplotlib.figure import Figure
+
+    fig = Figure(figsize=figsize, dpi=dpi)
+    ax = fig.add_subplot()
+    _draw(ax, graph, compute_layout(graph, method, **options), with_labels)
+    if title:
+        ax.set_title(title)
+    buf = io.BytesIO()
+    fig.savefig(buf, format=fmt)
+    return buf.getvalue()
+
+
+def visualize_graph(graph, title="Graph Visualization", method='spring', **options):
+    import matplotlib.pyplot as plt
+
+    fig, ax = plt.subplots(figsize=(10, 8))
+    _draw(ax, graph, compute_layout(graph, method, **options))
+    ax.set_title(title)
     plt.show()
+    plt.close(fig)
+
+
+def sample_graph_to_cytoscape_json(graph, positions=None, scale=1000):
+    # Accepts networkx-style graphs (nodes()/edges()) as well as Graph, CSRGraph and views.
+    if hasattr(graph, 'nodes'):
+        vertices, edges = graph.nodes(), graph.edges()
+    else:
+        vertices, edges = graph.get_vertices(), graph.get_edges()
+    nodes = []
+    for node in vertices:
+        entry = {'data': {'id': str(node)}}
+        if positions is not None and node in positions:
+            x, y = positions[node]
+            entry['position'] = {'x': x * scale, 'y': y * scale}
+        nodes.append(entry)
+    edge_entries = []
+    for edge in edges:
+        entry = {'data': {'source': str(edge[0]), 'target': str(edge[1])}}
+        if len(edge) == 3 and edge[2] is not None:
+            entry['data']['weight'] = edge[2]
+        edge_entries.append(entry)
+    return {'nodes': nodes, 'edges': edge_entries}
+
+
+def graph_to_cytoscape_json(graph, method='spring', scale=1000, **options):
+    return sample_graph_to_cytoscape_json(graph, layout_positions(graph, method, **options), scale)
 
-def sample_graph_to_cytoscape_json(graph):
-    nodes = [{'data': {'id': str(node)}} for node in graph.nodes()]
-    edges = [{'data': {'source': str(u), 'target': str(v)}} for u, v in graph.edges()]
-    return {'nodes': nodes, 'edges': edges}
 
 if __name__ == '__main__':
+    import json
+    import time
+
     from graph_theory.basics import Graph
-    
+    from graph_theory.generators import barabasi_albert
+
     g = Graph()
     g.add_edge('A', 'B', 5)
     g.add_edge('A', 'C', 3)
     g.add_edge('B', 'C', 2)
     g.add_edge('C', 'D', 4)
-    
-    visualize_graph(g, "Sample Weighted Graph")
-    
-    g_dir = Graph(directed=True)
-    g_dir.add_edge('X', 'Y')
-    g_dir.add_edge('Y', 'Z')
-    g_dir.add_edge('Z', 'X')
-    
-    visualize_graph(g_dir, "Sample Directed Graph")
-
-    G = nx.Graph()
-    G.add_edges_from([(1, 2), (1, 3), (2, 3), (3,4)])
-    
-    cytoscape_data = sample_graph_to_cytoscape_json(G)
-    import json
-    print(json.dumps(cytoscape_data, indent=2))
-    G.add_edges_from([(1, 2), (1, 3), (2, 3), (3,4)])
-    
-    cytoscape_data = sample_graph_to_cytoscape_json(G)
-    import json
-    print(json.dumps(cytoscape_data, indent=2))
+
+    print(json.dumps(graph_to_cytoscape_json(g), indent=2))
+    print(f"Spectral positions: {layout_positions(g, 'spectral')}")
+
+    big = barabasi_albert(10000, 2, seed=1)
+    for method in LAYOUTS:
+        start = time.perf_counter()
+        compute_layout(big, method)
+        first = time.perf_counter() - start
+        start = time.perf_counter()
+        compute_layout(big, method)
+        print(f"{method} layout of {big.num_vertices} vertices: {first:.2f}s, cached: {time.perf_counter() - start:.6f}s")
+
+    try:
+        png = render_graph(g, 'png', title="Sample Weighted Graph")
+        print(f"Rendered PNG: {len(png)} bytes")
+    except ImportError:
+        print("matplotlib is not installed; skipping rendering")
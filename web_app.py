@@ -1,6 +1,7 @@
 import sys
 import os
 import re
+import json
 import numpy as np
 try:
     from scipy import sparse
@@ -15,7 +16,7 @@ project_root_dir = os.path.dirname(project_package_dir) # .../v0.0.27 (directory
 if project_root_dir not in sys.path:
     sys.path.insert(0, project_root_dir)
 
-from flask import Flask, render_template, request, jsonify, send_from_directory, send_file, session
+from flask import Flask, render_template, request, jsonify, send_from_directory, send_file, session, Response, stream_with_context
 import sys
 from automata.dfa import DFA
 from automata.nfa import NFA
@@ -34,15 +35,19 @@ from discrete_probability.random_variables import pmf_binomial, pmf_poisson, pmf
 from logic.propositional import generate_truth_table_from_string, check_logical_equivalence_from_strings
 from number_theory.divisibility import gcd, lcm, divisors, prime_factorization, euler_totient, chinese_remainder_theorem
 from number_theory.cryptography import modular_exponentiation, modular_inverse, rsa_encrypt, rsa_decrypt, generate_rsa_keys
-from graph_theory.basics import Graph
-from graph_theory.algorithms import depth_first_search, breadth_first_search, find_connected_components, has_cycle, has_cycle_undirected, kruskal_mst, dijkstra
+from graph_theory.loaders import csr_from_payload
+from graph_theory.batch import GRAPH_OPERATIONS, QUERY_OPTIONS, run_query, run_batch
+from graph_theory.store import GraphStore, UnknownGraphHandle
+from graph_theory.walks import walk_count_matrix, walk_count_row, to_nested_list
+from visualization.graph_viz import graph_to_cytoscape_json, render_graph
 from marshmallow import Schema, fields, ValidationError
 from dotenv import load_dotenv
 import io
 from PIL import Image
 import easyocr
 from utils import mcp_client
-from utils.config import MCP_ENABLED, MCP_SERVER_URL
+from utils.config import (MCP_ENABLED, MCP_SERVER_URL, GRAPH_STORE_MAX_BYTES, GRAPH_BATCH_PROCESSES,
+                          GRAPH_LAYOUT_CACHE_BYTES)
 import base64
 import matplotlib.pyplot as plt
 from scipy.stats import binom, poisson, geom, hypergeom, nbinom
@@ -57,6 +62,13 @@ CORS(app)
 
 app.config['DEBUG'] = True
 
+graph_store = GraphStore(max_bytes=GRAPH_STORE_MAX_BYTES)
+# Inline graphs sent to the layout endpoint get their own cache, so they can never
+# evict a handle a client registered through /api/graph/store.
+layout_cache = GraphStore(max_bytes=GRAPH_LAYOUT_CACHE_BYTES)
+# Worker processes per batch request; opt-in and never more than the machine has.
+BATCH_PROCESSES = max(1, min(GRAPH_BATCH_PROCESSES, os.cpu_count() or 1))
+
 if not os.environ.get("OPENROUTER_API_KEY"):
     print("[ERROR] OPENROUTER_API_KEY is not set. Please set it as an environment variable.")
 else:
@@ -208,12 +220,27 @@ class AutomataSchema(Schema):
     regex = fields.Str(required=False)
     input_string = fields.Str(required=False)
 
-class GraphTheorySchema(Schema):
+QUERY_FIELDS = {
+    object: fields.Raw,
+    str: fields.Str,
+    int: fields.Integer,
+    float: fields.Float,
+    bool: fields.Bool,
+    dict: fields.Dict,
+    list: lambda **kwargs: fields.List(fields.Raw(), **kwargs),
+}
+
+class GraphTheoryRequestSchema(Schema):
     operation = fields.Str(required=True)
     graph = fields.Dict(required=False)
+    graph_handle = fields.Str(required=False)
     start = fields.Str(required=False)
     end = fields.Str(required=False)
 
+# Operation options come from graph_theory.batch so the schema cannot drift from what run_query reads.
+GraphTheorySchema = GraphTheoryRequestSchema.from_dict(
+    {name: QUERY_FIELDS[kind](required=False) for name, kind in QUERY_OPTIONS.items()}, name='GraphTheorySchema')
+
 class PDASchema(Schema):
     states = fields.List(fields.Str(), required=True)
     input_alphabet = fields.List(fields.Str(), required=True)
@@ -734,41 +761,87 @@ def api_automata():
     except Exception as e:
         return jsonify({'error': str(e)}), 400
 
+def resolve_graph(data):
+    if data.get('graph_handle'):
+        return graph_store.get(data['graph_handle'], 'graph')
+    return csr_from_payload(data.get('graph') or {})
+
+@app.route('/api/graph/store', methods=['POST'])
+def api_graph_store():
+    try:
+        data = request.get_json()
+        if data.get('graph') is not None:
+            handle = graph_store.put('graph', data['graph'], csr_from_payload)
+            kind = 'graph'
+        elif any(data.get(key) is not None for key in ('matrix', 'coo', 'csr')):
+            payload = {key: data[key] for key in ('matrix', 'coo', 'csr') if data.get(key) is not None}
+            handle = graph_store.put('adjacency', payload, load_adjacency)
+            kind = 'adjacency'
+        else:
+            return jsonify({'error': 'Missing graph or matrix'}), 400
+        return jsonify({'result': {'handle': handle, 'kind': kind}})
+    except Exception as e:
+        return jsonify({'error': str(e)}), 400
+
 @app.route('/api/graph_theory', methods=['POST'])
 def api_graph_theory():
     try:
         data = GraphTheorySchema().load(request.get_json())
         operation = data.get('operation')
-        graph_data = data.get('graph')
-        graph = Graph(directed=graph_data.get('directed', False))
-        for v in graph_data.get('vertices', []):
-            graph.add_vertex(v)
-        for edge in graph_data.get('edges', []):
-            graph.add_edge(edge['u'], edge['v'], edge.get('weight'))
-        result = None
-        if operation == 'dfs':
-            start_node = data.get('start_node')
-            result = depth_first_search(graph, start_node)
-        elif operation == 'bfs':
-            start_node = data.get('start_node')
-            result = breadth_first_search(graph, start_node)
-        elif operation == 'connected_components':
-            result = find_connected_components(graph)
-        elif operation == 'has_cycle':
-            if graph.directed:
-                result = has_cycle(graph)
-            else:
-                result = has_cycle_undirected(graph)
-        elif operation == 'kruskal':
-            mst_edges, total_weight = kruskal_mst(graph)
-            result = {'edges': mst_edges, 'total_weight': total_weight}
-        elif operation == 'dijkstra':
-            start_node = data.get('start_node')
-            distances, predecessors = dijkstra(graph, start_node)
-            result = {'distances': distances, 'predecessors': predecessors}
-        else:
+        if operation not in GRAPH_OPERATIONS:
             return jsonify({'error': 'Unknown operation'}), 400
+        graph = resolve_graph(data)
+        result = run_query(graph, data)
         return jsonify({'result': result})
+    except UnknownGraphHandle as e:
+        return jsonify({'error': e.args[0]}), 404
+    except Exception as e:
+        return jsonify({'error': str(e)}), 400
+
+@app.route('/api/graph_theory/batch', methods=['POST'])
+def api_graph_theory_batch():
+    try:
+        data = request.get_json()
+        queries = data.get('queries', [])
+        if not isinstance(queries, list) or not all(isinstance(query, dict) for query in queries):
+            return jsonify({'error': 'queries must be a list of objects'}), 400
+        graph = resolve_graph(data)
+    except UnknownGraphHandle as e:
+        return jsonify({'error': e.args[0]}), 404
+    except Exception as e:
+        return jsonify({'error': str(e)}), 400
+
+    def generate():
+        for line in run_batch(graph, queries, BATCH_PROCESSES):
+            yield json.dumps(line, default=str) + '\n'
+
+    return Response(stream_with_context(generate()), mimetype='application/x-ndjson')
+
+@app.route('/api/graph/layout', methods=['POST'])
+def api_graph_layout():
+    try:
+        data = request.get_json()
+        handle = data.get('graph_handle')
+        if handle:
+            graph = graph_store.get(handle, 'graph')
+        else:
+            # The layout is cached on the parsed graph, so repeat views of the same payload reuse it.
+            graph = layout_cache.get(layout_cache.put('graph', data.get('graph') or {}, csr_from_payload))
+        method = data.get('method', 'spring')
+        options = {key: data[key] for key in ('iterations', 'seed') if key in data and method == 'spring'}
+        fmt = data.get('format', 'cytoscape')
+        if fmt == 'cytoscape':
+            response = {'result': graph_to_cytoscape_json(graph, method, **options)}
+        elif fmt in ('png', 'svg'):
+            image = render_graph(graph, fmt, method, title=data.get('title'), **options)
+            response = {'image': base64.b64encode(image).decode('utf-8'), 'format': fmt}
+        else:
+            return jsonify({'error': f"Unknown format '{fmt}'"}), 400
+        if handle:
+            response['graph_handle'] = handle
+        return jsonify(response)
+    except UnknownGraphHandle as e:
+        return jsonify({'error': e.args[0]}), 404
     except Exception as e:
         return jsonify({'error': str(e)}), 400
 
@@ -803,11 +876,11 @@ def adjacency_matrix():
 def adjacency_matrix_power():
     try:
         data = request.json
-        matrix = data.get('matrix')
+        adj = load_adjacency(data)
         power = data.get('power')
-        if matrix is None or power is None:
+        if adj is None or power is None:
             return jsonify({'result': None, 'error': 'Missing matrix or power'}), 400
-        result = local_matrix_power(matrix, power)
+        result = local_matrix_power(adj, power, data.get('modulus'), data.get('row'))
         return jsonify({'result': result, 'error': None})
     except Exception as e:
         return jsonify({'result': None, 'error': str(e)}), 500
@@ -815,22 +888,83 @@ def adjacency_matrix_power():
 @app.route('/api/graph/info', methods=['POST'])
 def graph_info():
     data = request.json
-    graph_data = data.get('graph')
-    result = local_graph_info(graph_data)
+    if data.get('graph_handle'):
+        try:
+            adj = graph_store.get(data['graph_handle'], 'adjacency')
+        except UnknownGraphHandle as e:
+            return jsonify({'error': e.args[0]}), 404
+        result = local_graph_info(data, adj)
+    else:
+        result = local_graph_info(data.get('graph'))
     return jsonify({'result': result, 'source': 'local'})
 
-def local_matrix_power(matrix, power):
-    arr = np.array(matrix, dtype=float)
-    result = np.linalg.matrix_power(arr, int(power))
-    return result.tolist()
-
-def local_graph_info(graph_data):
-    matrix = np.array(graph_data['matrix'], dtype=float)
-    n = matrix.shape[0]
+def load_adjacency(data):
+    # Accepts a dense 'matrix', or sparse 'coo' {row, col, data?, shape?} / 'csr' {indptr, indices, data?, shape?}.
+    if data.get('csr') is not None:
+        payload = data['csr']
+        indptr = np.asarray(payload['indptr'], dtype=np.int64)
+        indices = np.asarray(payload['indices'], dtype=np.int64)
+        values = np.asarray(payload.get('data', np.ones(len(indices))), dtype=float)
+        n = len(indptr) - 1
+        shape = tuple(payload.get('shape', (n, n)))
+        rows = np.repeat(np.arange(n), np.diff(indptr))
+    elif data.get('coo') is not None:
+        payload = data['coo']
+        rows = np.asarray(payload['row'], dtype=np.int64)
+        indices = np.asarray(payload['col'], dtype=np.int64)
+        values = np.asarray(payload.get('data', np.ones(len(rows))), dtype=float)
+        n = int(max(rows.max(initial=-1), indices.max(initial=-1))) + 1
+        shape = tuple(payload.get('shape', (n, n)))
+    elif data.get('matrix') is not None:
+        arr = np.array(data['matrix'], dtype=float)
+        return sparse.csr_matrix(arr) if HAS_SCIPY else arr
+    else:
+        return None
+    if HAS_SCIPY:
+        return sparse.csr_matrix((values, (rows, indices)), shape=shape)
+    arr = np.zeros(shape)
+    np.add.at(arr, (rows, indices), values)
+    return arr
+
+def adjacency_rows(adj):
+    if HAS_SCIPY and sparse.issparse(adj):
+        adj = sparse.csr_matrix(adj)
+        adj.sum_duplicates()
+        adj.eliminate_zeros()
+        return adj.indptr, adj.indices, adj.data
+    adj = np.asarray(adj)
+    rows, cols = np.nonzero(adj)
+    indptr = np.zeros(adj.shape[0] + 1, dtype=np.int64)
+    np.cumsum(np.bincount(rows, minlength=adj.shape[0]), out=indptr[1:])
+    return indptr, cols, adj[rows, cols]
+
+def adjacency_sums(adj):
+    indptr, indices, values = adjacency_rows(adj)
+    rows = np.repeat(np.arange(adj.shape[0]), np.diff(indptr))
+    row_sums = np.bincount(rows, weights=values, minlength=adj.shape[0])
+    col_sums = np.bincount(indices, weights=values, minlength=adj.shape[1])
+    return row_sums, col_sums
+
+def adjacency_neighbor_lists(adj):
+    indptr, indices, _ = adjacency_rows(adj)
+    return [row.tolist() for row in np.split(indices, indptr[1:-1])]
+
+def local_matrix_power(matrix, power, modulus=None, row=None):
+    modulus = None if modulus is None else int(modulus)
+    if row is not None:
+        return walk_count_row(matrix, int(row), power, modulus).tolist()
+    return to_nested_list(walk_count_matrix(matrix, power, modulus))
+
+def local_graph_info(graph_data, adj=None):
+    if adj is None:
+        adj = load_adjacency(graph_data)
+    n = adj.shape[0]
     directed = graph_data.get('directed', False)
     weighted = graph_data.get('weighted', False)
-    degrees = matrix.sum(axis=1) if directed else matrix.sum(axis=0) + matrix.sum(axis=1)
-    num_edges = int(matrix.sum()) if directed else int(matrix.sum() // 2)
+    row_sums, col_sums = adjacency_sums(adj)
+    degrees = row_sums if directed else col_sums + row_sums
+    total = row_sums.sum()
+    num_edges = int(total) if directed else int(total // 2)
     info = {
         'num_vertices': n,
         'num_edges': num_edges,
@@ -840,17 +974,35 @@ def local_graph_info(graph_data):
     }
     return info
 
+def _columns(adj):
+    # CSC keeps columns contiguous the way CSR keeps rows, so _row_of on it reads a column.
+    if HAS_SCIPY and sparse.issparse(adj):
+        return sparse.csc_matrix(adj)
+    return np.asarray(adj).T
+
+def resolve_adjacency_axes(data):
+    handle = data.get('graph_handle')
+    if not handle:
+        adj = load_adjacency(data)
+        return adj, None if adj is None else _columns(adj)
+    adj = graph_store.get(handle, 'adjacency')
+    # Built once per stored matrix, so repeated node queries stay O(degree).
+    columns = graph_store.put('adjacency_columns', {'graph_handle': handle}, lambda payload: _columns(adj))
+    return adj, graph_store.get(columns, 'adjacency_columns')
+
 @app.route('/api/adjacency_matrix/degree', methods=['POST'])
 def adjacency_matrix_degree():
     try:
         data = request.json
-        matrix = data.get('matrix')
+        adj, columns = resolve_adjacency_axes(data)
         node = data.get('node')
         directed = bool(data.get('directed', False))
-        if matrix is None or node is None:
+        if adj is None or node is None:
             return jsonify({'result': None, 'error': 'Missing matrix or node'}), 400
-        result = local_adjacency_matrix_degree(matrix, node, directed)
+        result = local_adjacency_matrix_degree(adj, node, directed, columns)
         return jsonify({'result': result, 'error': None})
+    except UnknownGraphHandle as e:
+        return jsonify({'result': None, 'error': e.args[0]}), 404
     except Exception as e:
         return jsonify({'result': None, 'error': str(e)}), 500
 
@@ -858,79 +1010,89 @@ def adjacency_matrix_degree():
 def adjacency_matrix_neighbors():
     try:
         data = request.json
-        matrix = data.get('matrix')
+        adj, columns = resolve_adjacency_axes(data)
         node = data.get('node')
         directed = bool(data.get('directed', False))
-        if matrix is None or node is None:
+        if adj is None or node is None:
             return jsonify({'result': None, 'error': 'Missing matrix or node'}), 400
-        result = local_adjacency_matrix_neighbors(matrix, node, directed)
+        result = local_adjacency_matrix_neighbors(adj, node, directed, columns)
         return jsonify({'result': result, 'error': None})
+    except UnknownGraphHandle as e:
+        return jsonify({'result': None, 'error': e.args[0]}), 404
     except Exception as e:
         return jsonify({'result': None, 'error': str(e)}), 500
 
-def local_adjacency_matrix_degree(matrix, node, directed):
-    import numpy as np
-    arr = np.array(matrix, dtype=int)
-    if not (0 <= node < arr.shape[0]):
+def _row_of(adj, node):
+    # Reads one slice of the compressed arrays, so the cost is the row's length.
+    if HAS_SCIPY and sparse.issparse(adj):
+        start, end = adj.indptr[node], adj.indptr[node + 1]
+        indices, values = adj.indices[start:end], adj.data[start:end]
+    else:
+        row = np.asarray(adj)[node]
+        indices = np.flatnonzero(row)
+        values = row[indices]
+    keep = values != 0
+    return indices[keep], values[keep]
+
+def local_adjacency_matrix_degree(adj, node, directed, columns=None):
+    if not (0 <= node < adj.shape[0]):
         raise ValueError('Invalid node index')
+    columns = _columns(adj) if columns is None else columns
+    _, out_values = _row_of(adj, node)
+    _, in_values = _row_of(columns, node)
+    out_deg = int(out_values.astype(int).sum())
+    in_deg = int(in_values.astype(int).sum())
     if directed:
-        in_deg = int(arr[:, node].sum())
-        out_deg = int(arr[node, :].sum())
         return {'in_degree': in_deg, 'out_degree': out_deg, 'total': in_deg + out_deg}
     else:
-        deg = int(arr[node, :].sum() + arr[:, node].sum())
-        return {'degree': deg}
+        return {'degree': out_deg + in_deg}
 
-def local_adjacency_matrix_neighbors(matrix, node, directed):
-    import numpy as np
-    arr = np.array(matrix, dtype=int)
-    if not (0 <= node < arr.shape[0]):
+def local_adjacency_matrix_neighbors(adj, node, directed, columns=None):
+    if not (0 <= node < adj.shape[0]):
         raise ValueError('Invalid node index')
+    columns = _columns(adj) if columns is None else columns
+    out_neighbors, _ = _row_of(adj, node)
+    in_neighbors, _ = _row_of(columns, node)
     if directed:
-        out_neighbors = [int(j) for j in range(arr.shape[1]) if arr[node, j] != 0]
-        in_neighbors = [int(i) for i in range(arr.shape[0]) if arr[i, node] != 0]
-        return {'out_neighbors': out_neighbors, 'in_neighbors': in_neighbors}
+        return {'out_neighbors': np.sort(out_neighbors).tolist(), 'in_neighbors': np.sort(in_neighbors).tolist()}
     else:
-        neighbors = sorted(set([int(j) for j in range(arr.shape[1]) if arr[node, j] != 0] + [int(i) for i in range(arr.shape[0]) if arr[i, node] != 0]))
-        return {'neighbors': neighbors}
+        return {'neighbors': np.union1d(out_neighbors, in_neighbors).tolist()}
 
 @app.route('/api/adjacency_matrix/to_adjacency_list', methods=['POST'])
 def adjacency_matrix_to_adjacency_list():
     data = request.json
-    matrix = data.get('matrix')
-    if matrix is None:
+    adj = load_adjacency(data)
+    if adj is None:
         return jsonify({'error': 'Missing matrix'}), 400
-    arr = np.array(matrix)
-    n = arr.shape[0]
-    adj_list = {}
-    for i in range(n):
-        adj_list[str(i)] = [int(j) for j in range(n) if arr[i, j] != 0]
+    adj_list = {str(i): sorted(neighbors) for i, neighbors in enumerate(adjacency_neighbor_lists(adj))}
     return jsonify({'result': adj_list})
 
 @app.route('/api/adjacency_matrix/to_edge_list', methods=['POST'])
 def adjacency_matrix_to_edge_list():
     data = request.json
-    matrix = data.get('matrix')
-    if matrix is None:
+    adj = load_adjacency(data)
+    if adj is None:
         return jsonify({'error': 'Missing matrix'}), 400
-    arr = np.array(matrix)
-    n = arr.shape[0]
-    edge_list = []
-    for i in range(n):
-        for j in range(n):
-            if arr[i, j] != 0:
-                edge_list.append([int(i), int(j), float(arr[i, j])])
+    indptr, indices, values = adjacency_rows(adj)
+    rows = np.repeat(np.arange(adj.shape[0]), np.diff(indptr))
+    order = np.lexsort((indices, rows))
+    edge_list = [[i, j, w] for i, j, w in zip(rows[order].tolist(), indices[order].tolist(), values[order].astype(float).tolist())]
     return jsonify({'result': edge_list})
 
 @app.route('/api/adjacency_matrix/validate', methods=['POST'])
 def adjacency_matrix_validate():
     data = request.json
-    matrix = data.get('matrix')
-    if matrix is None:
+    adj = load_adjacency(data)
+    if adj is None:
         return jsonify({'error': 'Missing matrix'}), 400
-    arr = np.array(matrix)
-    square = arr.shape[0] == arr.shape[1]
-    symmetric = square and np.allclose(arr, arr.T)
+    square = adj.shape[0] == adj.shape[1]
+    if not square:
+        symmetric = False
+    elif HAS_SCIPY and sparse.issparse(adj):
+        excess = abs(adj - adj.T) - 1e-5 * abs(adj.T)
+        symmetric = excess.nnz == 0 or bool(excess.max() <= 1e-8)
+    else:
+        symmetric = bool(np.allclose(adj, adj.T))
     return jsonify({'result': {'square': square, 'symmetric': symmetric, 'error': None}})
 
 @app.route('/api/adjacency_matrix/attributes', methods=['POST'])
@@ -946,33 +1108,24 @@ def adjacency_matrix_attributes():
 @app.route('/api/adjacency_matrix/batch_analysis', methods=['POST'])
 def adjacency_matrix_batch_analysis():
     data = request.json
-    matrix = data.get('matrix')
+    adj = load_adjacency(data)
     directed = bool(data.get('directed', False))
-    if matrix is None:
+    if adj is None:
         return jsonify({'error': 'Missing matrix'}), 400
-    arr = np.array(matrix)
-    n = arr.shape[0]
-    use_sparse = HAS_SCIPY and n > 100
-    if use_sparse:
-        arr_sparse = sparse.csr_matrix(arr)
+    n = adj.shape[0]
+    row_sums, col_sums = adjacency_sums(adj)
+    out_degrees = row_sums.astype(int).tolist()
+    in_degrees = col_sums.astype(int).tolist()
+    out_lists = adjacency_neighbor_lists(adj)
+    in_lists = adjacency_neighbor_lists(adj.T)
     results = []
-    for i in range(n):
-        if use_sparse:
-            row = arr_sparse.getrow(i).toarray().ravel()
-            col = arr_sparse.getcol(i).toarray().ravel()
-        else:
-            row = arr[i, :]
-            col = arr[:, i]
-        if directed:
-            in_deg = int(col.sum())
-            out_deg = int(row.sum())
-            out_neighbors = [int(j) for j in range(n) if row[j] != 0]
-            in_neighbors = [int(j) for j in range(n) if col[j] != 0]
-            results.append({'node': i, 'in_degree': in_deg, 'out_degree': out_deg, 'total': in_deg+out_deg, 'in_neighbors': in_neighbors, 'out_neighbors': out_neighbors})
-        else:
-            deg = int(row.sum() + col.sum())
-            neighbors = sorted(set([int(j) for j in range(n) if row[j] != 0] + [int(j) for j in range(n) if col[j] != 0]))
-            results.append({'node': i, 'degree': deg, 'neighbors': neighbors})
+    if directed:
+        for i in range(n):
+            results.append({'node': i, 'in_degree': in_degrees[i], 'out_degree': out_degrees[i], 'total': in_degrees[i] + out_degrees[i], 'in_neighbors': sorted(in_lists[i]), 'out_neighbors': sorted(out_lists[i])})
+    else:
+        both_lists = adjacency_neighbor_lists(abs(adj) + abs(adj.T))
+        for i in range(n):
+            results.append({'node': i, 'degree': in_degrees[i] + out_degrees[i], 'neighbors': sorted(both_lists[i])})
     return jsonify({'result': results})
 
 @app.route('/api/probability', methods=['POST'])
@@ -1259,10 +1412,11 @@ def api_automata_batch_test():
             automaton = NFA(**automaton_data)
         else:
             return jsonify({'error': 'Unsupported automaton type'}), 400
-        results = []
-        for s in strings:
-            accepted = automaton.process_string(s)[0] if hasattr(automaton, 'process_string') else False
-            results.append({'string': s, 'accepted': accepted})
+        if automaton_type == 'dfa':
+            verdicts = automaton.accepts_many(strings)
+        else:
+            verdicts = [automaton.process_string(s)[0] for s in strings]
+        results = [{'string': s, 'accepted': accepted} for s, accepted in zip(strings, verdicts)]
         return jsonify({'result': results})
     except Exception as e:
         return jsonify({'error': str(e)}), 400